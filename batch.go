@@ -0,0 +1,201 @@
+package main
+
+import (
+	"bufio"
+	"fmt"
+	"log"
+	"os"
+	"regexp"
+	"strings"
+	"sync"
+
+	"gmaps2vcard/scraper"
+)
+
+// batchResult is the outcome for one input URL
+type batchResult struct {
+	URL      string
+	Filename string
+	Err      error
+}
+
+// featureIDRe matches the Maps feature ID ("0x...:0x...") embedded in place URLs
+var featureIDRe = regexp.MustCompile(`0x[0-9a-f]+:0x[0-9a-f]+`)
+
+// runBatch extracts every URL in path with at most workers extractions in flight
+// All workers share one Chrome (one tab each) and one HTTP keep-alive pool
+// URLs resolving to the same place are scraped once and share the result
+func runBatch(path string, workers int, config *scraper.Config) error {
+	urls, err := readURLs(path)
+	if err != nil {
+		return err
+	}
+	if len(urls) == 0 {
+		return fmt.Errorf("no URLs in %s", path)
+	}
+	if workers < 1 {
+		workers = 1
+	}
+
+	results := make([]batchResult, len(urls))
+
+	// Step 1: Validate + resolve short links concurrently (independent redirect round-trips overlap)
+	resolved := make([]string, len(urls))
+	forEachLimited(len(urls), workers, func(i int) {
+		results[i].URL = urls[i]
+
+		if !isValidGoogleMapsURL(urls[i]) {
+			results[i].Err = fmt.Errorf("not a valid Google Maps URL")
+			return
+		}
+
+		resolved[i], results[i].Err = scraper.Resolve(urls[i])
+	})
+
+	// Group inputs by place (input order, so output is deterministic)
+	var places []string          // unique place keys, first-seen order
+	groups := map[string][]int{} // place key → input indexes
+	resolvedURLs := map[string]string{}
+	for i := range urls {
+		if results[i].Err != nil {
+			continue
+		}
+
+		key := placeKey(resolved[i])
+		if _, seen := groups[key]; !seen {
+			places = append(places, key)
+			resolvedURLs[key] = resolved[i]
+		}
+		groups[key] = append(groups[key], i)
+	}
+
+	fmt.Fprintf(out, "→ Processing %d URLs (%d unique places, %d workers)...\n", len(urls), len(places), workers)
+
+	// Step 2: Extract each unique place
+	forEachLimited(len(places), workers, func(p int) {
+		key := places[p]
+		filename, err := processURL(resolvedURLs[key], config)
+
+		// Fan the one result out to every input that pointed at this place
+		for _, i := range groups[key] {
+			results[i].Filename = filename
+			results[i].Err = err
+		}
+	})
+
+	scraper.Close()
+
+	// Report in input order; failures go to stderr so -q still says which URL failed and why
+	failed := 0
+	fmt.Fprintln(out, "\nResults:")
+	for _, r := range results {
+		if r.Err != nil {
+			failed++
+			out.Flush() // keep the lines in order when stdout and stderr share a terminal
+			fmt.Fprintf(os.Stderr, "  ✗ %s: %v\n", r.URL, r.Err)
+		} else {
+			fmt.Fprintf(out, "  ✓ %s → %s\n", r.URL, r.Filename)
+		}
+	}
+
+	if failed > 0 {
+		return fmt.Errorf("%d of %d URLs failed", failed, len(urls))
+	}
+	fmt.Fprintf(out, "✓ %d vCards saved\n", len(places))
+	return nil
+}
+
+// forEachLimited runs fn(0..n-1) with at most limit calls in flight and waits for all
+// Sliding window: a new call starts as soon as any slot frees up
+func forEachLimited(n, limit int, fn func(i int)) {
+	slots := make(chan struct{}, limit)
+	var wg sync.WaitGroup
+
+	for i := 0; i < n; i++ {
+		wg.Add(1)
+		slots <- struct{}{}
+		go func(i int) {
+			defer wg.Done()
+			defer func() { <-slots }()
+			fn(i)
+		}(i)
+	}
+
+	wg.Wait()
+}
+
+// placeKey identifies the place behind a resolved URL for deduplication
+// Prefers the feature ID (stable across zoom/viewport variations), else the URL itself
+func placeKey(resolvedURL string) string {
+	if id := featureIDRe.FindString(resolvedURL); id != "" {
+		return id
+	}
+	return resolvedURL
+}
+
+// processURL runs the full single-URL pipeline and returns the vCard filename
+func processURL(inputURL string, config *scraper.Config) (string, error) {
+	business, err := scraper.Extract(inputURL, config)
+	if err != nil {
+		return "", fmt.Errorf("scraping failed: %w", err)
+	}
+	if business.Name == "" {
+		return "", fmt.Errorf("could not extract business name")
+	}
+
+	fillCoordinates(business)
+	hoursClean := parseHours(business)
+	photoBase64 := downloadPhoto(business)
+
+	filename := claimFilename(vcardFilename(business))
+	if err := saveVCard(filename, business, hoursClean, photoBase64); err != nil {
+		return "", err
+	}
+	return filename, nil
+}
+
+// Filenames handed out in this batch run - distinct places can share a name
+// (chain stores, the same name in two cities) and must not write the same file
+var (
+	claimedMu sync.Mutex
+	claimed   = map[string]bool{} // lowercased: macOS/Windows filesystems ignore case
+)
+
+// claimFilename reserves filename for this run, or "Name (2).vcf", "Name (3).vcf"... if taken
+// Files from earlier runs are still replaced, as in single-URL mode
+func claimFilename(filename string) string {
+	claimedMu.Lock()
+	defer claimedMu.Unlock()
+
+	base := strings.TrimSuffix(filename, ".vcf")
+	for n := 2; claimed[strings.ToLower(filename)]; n++ {
+		filename = fmt.Sprintf("%s (%d).vcf", base, n)
+	}
+	claimed[strings.ToLower(filename)] = true
+	return filename
+}
+
+// readURLs reads one URL per line, skipping blank lines and # comments
+func readURLs(path string) ([]string, error) {
+	f, err := os.Open(path)
+	if err != nil {
+		return nil, fmt.Errorf("failed to open batch file: %w", err)
+	}
+	defer f.Close()
+
+	var urls []string
+	scanner := bufio.NewScanner(f)
+	for scanner.Scan() {
+		line := strings.TrimSpace(scanner.Text())
+		if line == "" || strings.HasPrefix(line, "#") {
+			continue
+		}
+		urls = append(urls, line)
+	}
+	if err := scanner.Err(); err != nil {
+		return nil, fmt.Errorf("failed to read batch file: %w", err)
+	}
+
+	log.Printf("[Batch] Read %d URLs from %s", len(urls), path)
+	return urls, nil
+}
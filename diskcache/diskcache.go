@@ -0,0 +1,142 @@
+package diskcache
+
+import (
+	"encoding/json"
+	"log"
+	"os"
+	"path/filepath"
+	"sync"
+	"time"
+)
+
+// Store is a small persistent key → JSON value cache with per-entry expiry
+// Backed by one JSON file under the user cache dir (~/.cache/gmaps2vcard on Linux)
+// Failures are logged and treated as cache misses - the cache never breaks a run
+type Store struct {
+	name string
+	ttl  time.Duration
+	path string // resolved on first load
+
+	mu      sync.Mutex
+	loaded  bool
+	entries map[string]entry
+}
+
+type entry struct {
+	Value   json.RawMessage `json:"value"`
+	Expires time.Time       `json:"expires"`
+}
+
+// New returns a store named name whose entries live for ttl
+// Costs nothing until the first Get/Set - runs that never touch the cache never touch the disk
+func New(name string, ttl time.Duration) *Store {
+	return &Store{name: name, ttl: ttl}
+}
+
+// Get decodes the cached value for key into v, reporting whether it was found
+func (s *Store) Get(key string, v any) bool {
+	s.mu.Lock()
+	defer s.mu.Unlock()
+	s.load()
+
+	e, ok := s.entries[key]
+	if !ok || time.Now().After(e.Expires) {
+		return false
+	}
+	return json.Unmarshal(e.Value, v) == nil
+}
+
+// Set stores v under key for the store's TTL and writes the cache file
+func (s *Store) Set(key string, v any) {
+	s.SetTTL(key, v, s.ttl)
+}
+
+// SetTTL is Set with a per-entry lifetime (e.g. shorter for less trustworthy values)
+func (s *Store) SetTTL(key string, v any, ttl time.Duration) {
+	value, err := json.Marshal(v)
+	if err != nil {
+		log.Printf("[Cache] ⚠ Failed to encode %q: %v", key, err)
+		return
+	}
+
+	s.mu.Lock()
+	defer s.mu.Unlock()
+	s.load()
+
+	s.entries[key] = entry{Value: value, Expires: time.Now().Add(ttl)}
+	if err := s.save(key); err != nil {
+		log.Printf("[Cache] ⚠ Failed to write %s: %v", s.path, err)
+	}
+}
+
+// load reads the cache file once (missing or corrupt file = empty cache)
+func (s *Store) load() {
+	if s.loaded {
+		return
+	}
+	s.loaded = true
+
+	dir, err := os.UserCacheDir()
+	if err != nil {
+		dir = os.TempDir()
+	}
+	s.path = filepath.Join(dir, "gmaps2vcard", s.name+".json")
+	s.entries = s.read()
+}
+
+// read decodes the cache file (missing or corrupt file = no entries)
+func (s *Store) read() map[string]entry {
+	// Decode straight from the file - no intermediate copy of the whole file
+	f, err := os.Open(s.path)
+	if err != nil {
+		return map[string]entry{}
+	}
+	defer f.Close()
+
+	entries := map[string]entry{}
+	if err := json.NewDecoder(f).Decode(&entries); err != nil {
+		log.Printf("[Cache] ⚠ Ignoring corrupt cache %s: %v", s.path, err)
+		return map[string]entry{}
+	}
+	return entries
+}
+
+// save merges in what other processes wrote since load (concurrent runs, e.g. xargs -P),
+// drops expired entries and atomically replaces the cache file
+// Per key the later expiry wins, except setKey - the value just stored always does
+// There is no file lock: two saves within the same instant can still drop one entry
+func (s *Store) save(setKey string) error {
+	for key, e := range s.read() {
+		if mine, ok := s.entries[key]; key == setKey || ok && !e.Expires.After(mine.Expires) {
+			continue
+		}
+		s.entries[key] = e
+	}
+
+	now := time.Now()
+	for key, e := range s.entries {
+		if now.After(e.Expires) {
+			delete(s.entries, key)
+		}
+	}
+
+	if err := os.MkdirAll(filepath.Dir(s.path), 0755); err != nil {
+		return err
+	}
+
+	tmp, err := os.CreateTemp(filepath.Dir(s.path), filepath.Base(s.path)+".*")
+	if err != nil {
+		return err
+	}
+	// Encode straight into the temp file (entry values are already-encoded RawMessage)
+	if err := json.NewEncoder(tmp).Encode(s.entries); err != nil {
+		tmp.Close()
+		os.Remove(tmp.Name())
+		return err
+	}
+	if err := tmp.Close(); err != nil {
+		os.Remove(tmp.Name())
+		return err
+	}
+	return os.Rename(tmp.Name(), s.path)
+}
@@ -0,0 +1,157 @@
+package diskcache
+
+import (
+	"encoding/json"
+	"os"
+	"path/filepath"
+	"testing"
+	"time"
+)
+
+// isolate points the user cache dir at a temp dir (os.UserCacheDir reads these)
+func isolate(t *testing.T) {
+	t.Helper()
+	dir := t.TempDir()
+	t.Setenv("XDG_CACHE_HOME", dir)
+	t.Setenv("HOME", dir)
+}
+
+// fileEntries decodes the store's cache file as written on disk
+func fileEntries(t *testing.T, s *Store) map[string]entry {
+	t.Helper()
+	data, err := os.ReadFile(s.path)
+	if err != nil {
+		t.Fatalf("reading cache file: %v", err)
+	}
+	var entries map[string]entry
+	if err := json.Unmarshal(data, &entries); err != nil {
+		t.Fatalf("cache file is not valid JSON: %v", err)
+	}
+	return entries
+}
+
+func TestSetGetPersists(t *testing.T) {
+	isolate(t)
+
+	New("test", time.Hour).Set("k", "v")
+
+	// A new Store stands in for the next run
+	var got string
+	if !New("test", time.Hour).Get("k", &got) || got != "v" {
+		t.Errorf("Get(k) = %q, want %q from disk", got, "v")
+	}
+	if New("test", time.Hour).Get("missing", &got) {
+		t.Errorf("Get(missing) reported a hit")
+	}
+}
+
+func TestExpiredEntryIsAMiss(t *testing.T) {
+	isolate(t)
+
+	s := New("test", time.Hour)
+	s.SetTTL("k", "v", time.Millisecond)
+	time.Sleep(5 * time.Millisecond)
+
+	var got string
+	if s.Get("k", &got) {
+		t.Errorf("Get(k) after expiry = %q, want miss", got)
+	}
+	if New("test", time.Hour).Get("k", &got) {
+		t.Errorf("Get(k) after expiry from disk = %q, want miss", got)
+	}
+}
+
+func TestSetTTLOverridesStoreTTL(t *testing.T) {
+	isolate(t)
+
+	s := New("test", 30*24*time.Hour)
+	s.Set("full", 1)
+	s.SetTTL("short", 2, 24*time.Hour)
+
+	entries := fileEntries(t, s)
+	if left := time.Until(entries["full"].Expires); left < 29*24*time.Hour {
+		t.Errorf("Set expires in %v, want the store TTL (30 days)", left)
+	}
+	if left := time.Until(entries["short"].Expires); left > 24*time.Hour || left < 23*time.Hour {
+		t.Errorf("SetTTL expires in %v, want 24h", left)
+	}
+}
+
+func TestCorruptFileIsAnEmptyCache(t *testing.T) {
+	isolate(t)
+
+	s := New("test", time.Hour)
+	s.load()
+	if err := os.MkdirAll(filepath.Dir(s.path), 0755); err != nil {
+		t.Fatal(err)
+	}
+	if err := os.WriteFile(s.path, []byte(`{"k": {"value": tru`), 0644); err != nil {
+		t.Fatal(err)
+	}
+
+	s = New("test", time.Hour)
+	var got string
+	if s.Get("k", &got) {
+		t.Errorf("Get(k) from corrupt file = %q, want miss", got)
+	}
+
+	s.Set("k", "v")
+	if entries := fileEntries(t, s); string(entries["k"].Value) != `"v"` {
+		t.Errorf("rewritten file has k = %s, want \"v\"", entries["k"].Value)
+	}
+}
+
+func TestSaveLeavesNoTempFiles(t *testing.T) {
+	isolate(t)
+
+	s := New("test", time.Hour)
+	for i := 0; i < 3; i++ {
+		s.Set("k", i)
+	}
+
+	files, err := os.ReadDir(filepath.Dir(s.path))
+	if err != nil {
+		t.Fatal(err)
+	}
+	if len(files) != 1 || files[0].Name() != "test.json" {
+		var names []string
+		for _, f := range files {
+			names = append(names, f.Name())
+		}
+		t.Errorf("cache dir holds %v, want only test.json", names)
+	}
+}
+
+func TestConcurrentRunsKeepEachOthersEntries(t *testing.T) {
+	isolate(t)
+
+	// Both "runs" load before either writes, as with xargs -P
+	a, b := New("test", time.Hour), New("test", time.Hour)
+	var got string
+	a.Get("x", &got)
+	b.Get("x", &got)
+
+	a.Set("from-a", "a")
+	b.Set("from-b", "b")
+	a.Set("from-a-again", "a2")
+
+	next := New("test", time.Hour)
+	for key, want := range map[string]string{"from-a": "a", "from-b": "b", "from-a-again": "a2"} {
+		if !next.Get(key, &got) || got != want {
+			t.Errorf("Get(%s) = %q, want %q", key, got, want)
+		}
+	}
+}
+
+func TestMergeKeepsTheJustSetValue(t *testing.T) {
+	isolate(t)
+
+	a, b := New("test", time.Hour), New("test", time.Hour)
+	a.Set("k", "long")                  // another run stored a longer-lived value
+	b.SetTTL("k", "short", time.Minute) // -fresh replaces it with a shorter one
+
+	var got string
+	if !New("test", time.Hour).Get("k", &got) || got != "short" {
+		t.Errorf("Get(k) = %q, want the value just set (%q)", got, "short")
+	}
+}
@@ -0,0 +1,96 @@
+package geocode
+
+import (
+	"encoding/json"
+	"fmt"
+	"log"
+	"net/http"
+	"net/url"
+	"sync"
+	"time"
+
+	"gmaps2vcard/diskcache"
+	"gmaps2vcard/httpclient"
+)
+
+// Nominatim (OpenStreetMap) usage policy: at most 1 request/s and an identifying User-Agent
+// https://operations.osmfoundation.org/policies/nominatim/
+const (
+	searchURL   = "https://nominatim.openstreetmap.org/search"
+	userAgent   = "gmaps2vcard (+https://github.com/adriangalilea/gmaps2vcard)"
+	minInterval = time.Second
+)
+
+// Result is the best match for a query (empty Lat/Lon if nothing matched)
+type Result struct {
+	Lat string `json:"lat"`
+	Lon string `json:"lon"`
+}
+
+// cache keeps results (misses included) - addresses don't move and Nominatim asks clients to cache
+var cache = diskcache.New("geocode", 30*24*time.Hour)
+
+// Token bucket of one: the next request may start at nextSlot (shared by all batch workers)
+var (
+	slotMu   sync.Mutex
+	nextSlot time.Time
+)
+
+// Lookup geocodes a free-text address via Nominatim
+// Used only as a fallback when the Maps page yielded no coordinates
+func Lookup(query string) (*Result, error) {
+	var result Result
+	if cache.Get(query, &result) {
+		log.Printf("[Geocode] ✓ Cache hit: %s", query)
+		return &result, nil
+	}
+
+	req, err := httpclient.NewRequest("GET", searchURL+"?format=json&limit=1&q="+url.QueryEscape(query))
+	if err != nil {
+		return nil, fmt.Errorf("failed to build geocode request: %w", err)
+	}
+	req.Header.Set("User-Agent", userAgent)
+
+	waitForSlot()
+	log.Printf("[Geocode] Looking up: %s", query)
+
+	// One attempt per slot: the shared client's transient-status retries would
+	// send follow-up requests without waiting for the next slot
+	resp, err := httpclient.SingleAttemptClient.Do(req)
+	if err != nil {
+		return nil, fmt.Errorf("geocode request failed: %w", err)
+	}
+	defer resp.Body.Close()
+
+	if resp.StatusCode != http.StatusOK {
+		return nil, fmt.Errorf("geocode bad status: %s", resp.Status)
+	}
+
+	var matches []Result
+	if err := json.NewDecoder(resp.Body).Decode(&matches); err != nil {
+		return nil, fmt.Errorf("failed to decode geocode response: %w", err)
+	}
+	if len(matches) > 0 {
+		result = matches[0]
+		log.Printf("[Geocode] ✓ %s, %s", result.Lat, result.Lon)
+	} else {
+		log.Printf("[Geocode] No match for: %s", query)
+	}
+
+	cache.Set(query, result)
+	return &result, nil
+}
+
+// waitForSlot blocks until this caller may send the next request (minInterval apart)
+func waitForSlot() {
+	slotMu.Lock()
+	now := time.Now()
+	wait := nextSlot.Sub(now)
+	if wait < 0 {
+		wait = 0
+	}
+	nextSlot = now.Add(wait + minInterval)
+	slotMu.Unlock()
+
+	time.Sleep(wait)
+}
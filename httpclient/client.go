@@ -0,0 +1,155 @@
+package httpclient
+
+import (
+	"fmt"
+	"net"
+	"net/http"
+	"strconv"
+	"time"
+)
+
+// UserAgent is the browser User-Agent used for every outgoing request (HTTP and chromedp)
+const UserAgent = "Mozilla/5.0 (Macintosh; Intel Mac OS X 10_15_7) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/120.0.0.0 Safari/537.36"
+
+// MaxRedirects caps redirect chains (share.google → maps needs 2-3 hops)
+const MaxRedirects = 5
+
+// Client is the shared HTTP client for redirects and image downloads
+// One Transport = one keep-alive pool, so repeated requests to the same host skip the TLS handshake
+var Client = &http.Client{
+	Transport: &retryTransport{base: transport},
+	CheckRedirect: func(req *http.Request, via []*http.Request) error {
+		if len(via) >= MaxRedirects {
+			return fmt.Errorf("stopped after %d redirects", MaxRedirects)
+		}
+		return nil
+	},
+	Timeout: 10 * time.Second,
+}
+
+// transport is the keep-alive pool behind every client in this package
+// Connect and header timeouts are split so a dead host fails in seconds, not the whole budget
+var transport = &http.Transport{
+	Proxy:                 http.ProxyFromEnvironment,
+	DialContext:           (&net.Dialer{Timeout: 3 * time.Second, KeepAlive: 30 * time.Second}).DialContext,
+	MaxIdleConns:          4, // = default -workers, so every batch worker keeps a warm connection
+	MaxIdleConnsPerHost:   4,
+	IdleConnTimeout:       90 * time.Second,
+	TLSHandshakeTimeout:   3 * time.Second,
+	ResponseHeaderTimeout: 7 * time.Second,
+	// A custom DialContext silently turns HTTP/2 off; re-enable it so concurrent
+	// requests to one Google host multiplex over a single TLS connection
+	ForceAttemptHTTP2: true,
+}
+
+// NoRedirectClient shares Client's pool but returns 3xx responses as-is
+// For callers that walk redirect chains hop by hop and stop early
+var NoRedirectClient = &http.Client{
+	Transport: Client.Transport,
+	CheckRedirect: func(req *http.Request, via []*http.Request) error {
+		return http.ErrUseLastResponse
+	},
+	Timeout: Client.Timeout,
+}
+
+// SingleAttemptClient shares Client's pool but sends each request exactly once
+// For rate-limited APIs whose callers pace every request themselves (no hidden retries)
+var SingleAttemptClient = &http.Client{
+	Transport:     transport,
+	CheckRedirect: Client.CheckRedirect,
+	Timeout:       Client.Timeout,
+}
+
+// Transient-status retries: 2 retries, 200ms then 400ms backoff
+// A server-sent Retry-After wins; longer than maxRetryAfter is not worth waiting for
+const (
+	maxRetries    = 2
+	retryBackoff  = 200 * time.Millisecond
+	maxRetryAfter = 3 * time.Second
+)
+
+// retryTransport retries idempotent requests that got a transient status (429/5xx)
+// Network errors are returned as-is: the split timeouts above already bound them
+type retryTransport struct {
+	base http.RoundTripper
+}
+
+func (t *retryTransport) RoundTrip(req *http.Request) (*http.Response, error) {
+	for attempt := 0; ; attempt++ {
+		resp, err := t.base.RoundTrip(req)
+		if err != nil || attempt >= maxRetries || !retryable(req, resp) {
+			return resp, err
+		}
+
+		delay, ok := retryDelay(resp, attempt)
+		if !ok {
+			return resp, nil
+		}
+		resp.Body.Close()
+
+		select {
+		case <-time.After(delay):
+		case <-req.Context().Done():
+			return nil, req.Context().Err()
+		}
+	}
+}
+
+// retryable reports whether resp is a transient failure of a safely repeatable request
+func retryable(req *http.Request, resp *http.Response) bool {
+	if req.Body != nil && req.Body != http.NoBody {
+		return false
+	}
+	if req.Method != http.MethodGet && req.Method != http.MethodHead {
+		return false
+	}
+
+	switch resp.StatusCode {
+	case http.StatusTooManyRequests, http.StatusInternalServerError, http.StatusBadGateway,
+		http.StatusServiceUnavailable, http.StatusGatewayTimeout:
+		return true
+	}
+	return false
+}
+
+// retryDelay returns how long to wait before retrying resp, honoring Retry-After
+// A 429 is only retried when the server says when: resending it blind is exactly
+// what a rate limit (e.g. Nominatim's 1 request/s) asks clients not to do
+func retryDelay(resp *http.Response, attempt int) (time.Duration, bool) {
+	delay := retryBackoff << attempt
+
+	header := resp.Header.Get("Retry-After")
+	if header == "" {
+		return delay, resp.StatusCode != http.StatusTooManyRequests
+	}
+
+	var after time.Duration
+	if seconds, err := strconv.Atoi(header); err == nil {
+		after = time.Duration(seconds) * time.Second
+	} else if date, err := http.ParseTime(header); err == nil {
+		after = time.Until(date)
+	} else {
+		return delay, resp.StatusCode != http.StatusTooManyRequests
+	}
+
+	if after > maxRetryAfter {
+		return 0, false
+	}
+	if after > delay {
+		delay = after
+	}
+	return delay, true
+}
+
+// NewRequest creates a request with legitimate browser headers already set
+func NewRequest(method, rawURL string) (*http.Request, error) {
+	req, err := http.NewRequest(method, rawURL, nil)
+	if err != nil {
+		return nil, err
+	}
+
+	req.Header.Set("User-Agent", UserAgent)
+	req.Header.Set("Accept-Language", "en-US,en;q=0.9")
+
+	return req, nil
+}
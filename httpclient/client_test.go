@@ -0,0 +1,86 @@
+package httpclient
+
+import (
+	"net/http"
+	"net/http/httptest"
+	"strconv"
+	"sync/atomic"
+	"testing"
+	"time"
+)
+
+func TestRetryDelay(t *testing.T) {
+	tests := []struct {
+		name       string
+		status     int
+		retryAfter string
+		attempt    int
+		want       time.Duration
+		wantRetry  bool
+	}{
+		{"5xx uses backoff", http.StatusServiceUnavailable, "", 0, retryBackoff, true},
+		{"5xx backoff doubles", http.StatusBadGateway, "", 1, 2 * retryBackoff, true},
+		{"429 without header is not retried", http.StatusTooManyRequests, "", 0, 0, false},
+		{"integer seconds", http.StatusTooManyRequests, "1", 0, time.Second, true},
+		{"shorter than backoff keeps backoff", http.StatusServiceUnavailable, "0", 1, 2 * retryBackoff, true},
+		{"over maxRetryAfter", http.StatusTooManyRequests, strconv.Itoa(int(maxRetryAfter/time.Second) + 1), 0, 0, false},
+		{"malformed header on 429", http.StatusTooManyRequests, "soon", 0, 0, false},
+		{"malformed header on 5xx falls back to backoff", http.StatusServiceUnavailable, "soon", 0, retryBackoff, true},
+	}
+
+	for _, tt := range tests {
+		t.Run(tt.name, func(t *testing.T) {
+			resp := &http.Response{StatusCode: tt.status, Header: http.Header{}}
+			if tt.retryAfter != "" {
+				resp.Header.Set("Retry-After", tt.retryAfter)
+			}
+
+			got, ok := retryDelay(resp, tt.attempt)
+			if ok != tt.wantRetry {
+				t.Fatalf("retryDelay() retry = %v, want %v", ok, tt.wantRetry)
+			}
+			if ok && got != tt.want {
+				t.Errorf("retryDelay() = %v, want %v", got, tt.want)
+			}
+		})
+	}
+}
+
+func TestRetryDelayHTTPDate(t *testing.T) {
+	resp := &http.Response{StatusCode: http.StatusTooManyRequests, Header: http.Header{}}
+
+	// HTTP dates have one-second resolution: 2s ahead lands between 1s and 2s
+	resp.Header.Set("Retry-After", time.Now().Add(2*time.Second).UTC().Format(http.TimeFormat))
+	got, ok := retryDelay(resp, 0)
+	if !ok || got < time.Second || got > 2*time.Second {
+		t.Errorf("retryDelay(date in 2s) = %v, %v; want 1s-2s, true", got, ok)
+	}
+
+	resp.Header.Set("Retry-After", time.Now().Add(time.Minute).UTC().Format(http.TimeFormat))
+	if _, ok := retryDelay(resp, 0); ok {
+		t.Errorf("retryDelay(date in 1m) retried, want give up (over maxRetryAfter)")
+	}
+}
+
+func TestRoundTripStopsAfterMaxRetries(t *testing.T) {
+	var requests atomic.Int32
+	srv := httptest.NewServer(http.HandlerFunc(func(w http.ResponseWriter, r *http.Request) {
+		requests.Add(1)
+		w.WriteHeader(http.StatusServiceUnavailable)
+	}))
+	defer srv.Close()
+
+	client := &http.Client{Transport: &retryTransport{base: srv.Client().Transport}}
+	resp, err := client.Get(srv.URL)
+	if err != nil {
+		t.Fatalf("Get: %v", err)
+	}
+	resp.Body.Close()
+
+	if resp.StatusCode != http.StatusServiceUnavailable {
+		t.Errorf("status = %d, want %d", resp.StatusCode, http.StatusServiceUnavailable)
+	}
+	if got := requests.Load(); got != maxRetries+1 {
+		t.Errorf("server saw %d requests, want %d (1 + %d retries)", got, maxRetries+1, maxRetries)
+	}
+}
@@ -6,15 +6,26 @@ import (
 	"io"
 	"log"
 	"net/http"
+	"strings"
+
+	"gmaps2vcard/httpclient"
 )
 
+// maxImageBytes caps the photo download (Maps hero images are ~100-500 KB)
+const maxImageBytes = 10 << 20
+
 // DownloadAndEncode downloads an image from a URL and returns it as base64
 // Pure function - no chromedp, just HTTP download and encoding
 func DownloadAndEncode(imageURL string) (string, error) {
 	log.Printf("[ImageExtractor] Downloading image from: %.80s...", imageURL)
 
-	// Download image
-	resp, err := http.Get(imageURL)
+	// Download image (shared client reuses the connection pool)
+	req, err := httpclient.NewRequest("GET", imageURL)
+	if err != nil {
+		return "", fmt.Errorf("failed to build image request: %w", err)
+	}
+
+	resp, err := httpclient.Client.Do(req)
 	if err != nil {
 		return "", fmt.Errorf("failed to download image: %w", err)
 	}
@@ -24,15 +35,26 @@ func DownloadAndEncode(imageURL string) (string, error) {
 		return "", fmt.Errorf("bad status: %s", resp.Status)
 	}
 
-	// Read image data
-	imageData, err := io.ReadAll(resp.Body)
+	// Stream body → base64 encoder → result (raw image bytes are never held in full)
+	// Output is pre-sized from Content-Length, so the builder never regrows
+	var encoded strings.Builder
+	if resp.ContentLength > 0 && resp.ContentLength <= maxImageBytes {
+		encoded.Grow(base64.StdEncoding.EncodedLen(int(resp.ContentLength)))
+	}
+
+	encoder := base64.NewEncoder(base64.StdEncoding, &encoded)
+	size, err := io.Copy(encoder, io.LimitReader(resp.Body, maxImageBytes+1))
 	if err != nil {
 		return "", fmt.Errorf("failed to read image: %w", err)
 	}
+	if size > maxImageBytes {
+		return "", fmt.Errorf("image larger than %d bytes", maxImageBytes)
+	}
+	if err := encoder.Close(); err != nil {
+		return "", fmt.Errorf("failed to encode image: %w", err)
+	}
+	base64Data := encoded.String()
 
-	// Encode to base64
-	base64Data := base64.StdEncoding.EncodeToString(imageData)
-
-	log.Printf("[ImageExtractor] ✓ Image downloaded and encoded (%d bytes)", len(imageData))
+	log.Printf("[ImageExtractor] ✓ Image downloaded and encoded (%d bytes)", size)
 	return base64Data, nil
 }
@@ -1,26 +1,51 @@
 package main
 
 import (
+	"bufio"
 	"flag"
 	"fmt"
+	"io"
 	"log"
-	"net/url"
 	"os"
 	"strings"
 	"time"
 
+	"gmaps2vcard/geocode"
 	"gmaps2vcard/imageextractor"
 	"gmaps2vcard/schedule"
 	"gmaps2vcard/scraper"
-
-	"github.com/emersion/go-vcard"
 )
 
+// out buffers all progress output; flushed once at exit (one write instead of one per line)
+var out = bufio.NewWriter(os.Stdout)
+
 func main() {
+	batchFile := flag.String("batch", "", "file with one Google Maps URL per line")
+	workers := flag.Int("workers", 4, "concurrent extractions in batch mode")
+	quiet := flag.Bool("q", false, "quiet: no progress or log output, errors only")
+	fresh := flag.Bool("fresh", false, "scrape again instead of using cached business data (the new result replaces the cached one)")
 	flag.Parse()
 
+	config := scraper.DefaultConfig()
+	config.Refresh = *fresh
+
+	if *quiet {
+		out.Reset(io.Discard)
+		log.SetOutput(io.Discard)
+	}
+	defer out.Flush()
+
+	if *batchFile != "" {
+		if err := runBatch(*batchFile, *workers, config); err != nil {
+			fatalf("Error: %v", err)
+		}
+		return
+	}
+
 	if flag.NArg() < 1 {
 		fmt.Fprintln(os.Stderr, "Usage: gmaps2vcard <google-maps-url>")
+		fmt.Fprintln(os.Stderr, "       gmaps2vcard -batch urls.txt [-workers 4]")
+		fmt.Fprintln(os.Stderr, "Flags: -q (quiet, errors only), -fresh (scrape again, update cache)")
 		fmt.Fprintln(os.Stderr, "\nExample:")
 		fmt.Fprintln(os.Stderr, "  gmaps2vcard 'https://share.google/w4UZTre3NvPyC3b3Q'")
 		os.Exit(1)
@@ -30,79 +55,167 @@ func main() {
 
 	// Validate URL
 	if !isValidGoogleMapsURL(inputURL) {
-		log.Fatalf("Error: Not a valid Google Maps URL: %s", inputURL)
+		fatalf("Error: Not a valid Google Maps URL: %s", inputURL)
 	}
-	fmt.Println("✓ Valid Google Maps URL")
+	fmt.Fprintln(out, "✓ Valid Google Maps URL")
 
 	// Extract ALL data in ONE chromedp session (handles URL normalization too)
-	fmt.Println("→ Extracting business data...")
-	business, err := scraper.Extract(inputURL, nil)
+	fmt.Fprintln(out, "→ Extracting business data...")
+	business, err := scraper.Extract(inputURL, config)
+	scraper.Close()
 	if err != nil {
-		log.Fatalf("Error scraping data: %v", err)
+		fatalf("Error scraping data: %v", err)
 	}
 
-	// Parse schedule (if hours found)
-	var hoursClean string
-	if business.Hours != "" {
-		parsedSchedule, err := schedule.Parse(business.Hours, false)
-		if err != nil {
-			log.Printf("⚠ Warning: schedule parsing failed: %v", err)
-		} else {
-			hoursClean = parsedSchedule.Format(false)
-		}
-	}
-
-	// Download and encode image (if URL found)
-	var photoBase64 string
-	if business.PhotoURL != "" {
-		photoBase64, err = imageextractor.DownloadAndEncode(business.PhotoURL)
-		if err != nil {
-			log.Printf("⚠ Warning: image download failed: %v", err)
-		}
-	}
+	fillCoordinates(business)
+	hoursClean := parseHours(business)
+	photoBase64 := downloadPhoto(business)
 
 	// Print extracted data
 	printBusinessData(business, hoursClean)
 
 	// Validate we have at least a name
 	if business.Name == "" {
-		log.Fatal("Error: Could not extract business name")
+		fatalf("Error: Could not extract business name")
+	}
+
+	// Generate vCard and save to file
+	fmt.Fprintln(out, "\n→ Generating vCard...")
+	filename := vcardFilename(business)
+	if err := saveVCard(filename, business, hoursClean, photoBase64); err != nil {
+		fatalf("Error writing vCard: %v", err)
 	}
 
-	// Generate vCard
-	fmt.Println("\n→ Generating vCard...")
-	vcardData := generateVCard(business, hoursClean, photoBase64)
+	fmt.Fprintf(out, "✓ vCard saved to: %s\n", filename)
+	fmt.Fprintln(out, "\nYou can now import this file to your contacts app or iCloud.")
+}
+
+// fatalf flushes buffered output, reports the error on stderr (even with -q) and exits
+func fatalf(format string, args ...any) {
+	out.Flush()
+	fmt.Fprintf(os.Stderr, format+"\n", args...)
+	os.Exit(1)
+}
 
-	// Save to file
-	filename := strings.ReplaceAll(business.Name, "/", "-") + ".vcf"
-	if err := os.WriteFile(filename, []byte(vcardData), 0644); err != nil {
-		log.Fatalf("Error writing vCard: %v", err)
+// fillCoordinates geocodes the scraped address via Nominatim when Maps gave no coordinates
+// Never the bare name: a worldwide top match for "Café Central" is an arbitrary place
+func fillCoordinates(business *scraper.BusinessData) {
+	if business.Latitude != "" && business.Longitude != "" {
+		return
+	}
+	if business.Address == "" {
+		return
 	}
 
-	fmt.Printf("✓ vCard saved to: %s\n", filename)
-	fmt.Println("\nYou can now import this file to your contacts app or iCloud.")
+	result, err := geocode.Lookup(business.Address)
+	if err != nil {
+		log.Printf("⚠ Warning: geocoding failed: %v", err)
+		return
+	}
+	if result.Lat == "" || result.Lon == "" {
+		return
+	}
+
+	business.Latitude, business.Longitude = result.Lat, result.Lon
 }
 
-func isValidGoogleMapsURL(rawURL string) bool {
-	u, err := url.Parse(rawURL)
+// parseHours returns the clean schedule (empty if no hours or parsing failed)
+func parseHours(business *scraper.BusinessData) string {
+	if business.Hours == "" {
+		return ""
+	}
+
+	parsedSchedule, err := schedule.Parse(business.Hours, false)
 	if err != nil {
-		return false
+		log.Printf("⚠ Warning: schedule parsing failed: %v", err)
+		return ""
 	}
+	return parsedSchedule.Format(false)
+}
 
-	if u.Scheme != "http" && u.Scheme != "https" {
+// downloadPhoto returns the base64 photo (empty if no URL or download failed)
+func downloadPhoto(business *scraper.BusinessData) string {
+	if business.PhotoURL == "" {
+		return ""
+	}
+
+	photoBase64, err := imageextractor.DownloadAndEncode(business.PhotoURL)
+	if err != nil {
+		log.Printf("⚠ Warning: image download failed: %v", err)
+		return ""
+	}
+	return photoBase64
+}
+
+// vcardFilename is BusinessName.vcf ("/" would be a path separator)
+func vcardFilename(business *scraper.BusinessData) string {
+	return strings.ReplaceAll(business.Name, "/", "-") + ".vcf"
+}
+
+// saveVCard streams the vCard to filename (replacing any previous file)
+// No intermediate string: the (large) photo goes straight from memory to the file
+func saveVCard(filename string, business *scraper.BusinessData, hoursClean, photoBase64 string) error {
+	f, err := os.OpenFile(filename, os.O_WRONLY|os.O_CREATE|os.O_TRUNC, 0644)
+	if err != nil {
+		return err
+	}
+
+	if err := writeVCard(f, business, hoursClean, photoBase64); err != nil {
+		f.Close()
+		return err
+	}
+	return f.Close()
+}
+
+// validDomains are the accepted Google Maps hosts (built once, not per call)
+var validDomains = []string{
+	"share.google",
+	"maps.google.com",
+	"www.google.com",
+	"google.com",
+	"goo.gl",
+}
+
+// isValidGoogleMapsURL checks scheme and host with plain string ops instead of
+// a full url.Parse; only the host is needed to decide
+func isValidGoogleMapsURL(rawURL string) bool {
+	var rest string
+	switch {
+	case len(rawURL) > 8 && strings.EqualFold(rawURL[:8], "https://"):
+		rest = rawURL[8:]
+	case len(rawURL) > 7 && strings.EqualFold(rawURL[:7], "http://"):
+		rest = rawURL[7:]
+	default:
 		return false
 	}
 
-	validDomains := []string{
-		"share.google",
-		"maps.google.com",
-		"www.google.com",
-		"google.com",
-		"goo.gl",
+	// Browsers treat "\" like "/", so it ends the authority too
+	host := rest
+	if i := strings.IndexAny(host, `/?#\`); i >= 0 {
+		host = host[:i]
+	}
+	if i := strings.LastIndexByte(host, '@'); i >= 0 {
+		host = host[i+1:]
+	}
+	if i := strings.LastIndexByte(host, ':'); i >= 0 {
+		if !isDigits(host[i+1:]) {
+			return false
+		}
+		host = host[:i]
+	}
+	host = strings.ToLower(host)
+
+	// Plain DNS names only - "%40" escapes and other bytes url.Parse rejected stay rejected
+	for i := 0; i < len(host); i++ {
+		if c := host[i]; !('a' <= c && c <= 'z' || '0' <= c && c <= '9' || c == '.' || c == '-') {
+			return false
+		}
 	}
 
+	// Exact host or a subdomain of it; a bare suffix match would also accept
+	// look-alikes such as "notgoogle.com"
 	for _, domain := range validDomains {
-		if strings.HasSuffix(u.Host, domain) {
+		if host == domain || strings.HasSuffix(host, "."+domain) {
 			return true
 		}
 	}
@@ -110,24 +223,34 @@ func isValidGoogleMapsURL(rawURL string) bool {
 	return false
 }
 
+// isDigits reports whether s is all ASCII digits (an empty port is allowed, as in url.Parse)
+func isDigits(s string) bool {
+	for i := 0; i < len(s); i++ {
+		if s[i] < '0' || s[i] > '9' {
+			return false
+		}
+	}
+	return true
+}
+
 func printBusinessData(business *scraper.BusinessData, hoursClean string) {
-	fmt.Println("\nExtracted information:")
-	fmt.Printf("  Name: %s\n", orNotFound(business.Name))
-	fmt.Printf("  Address: %s\n", orNotFound(business.Address))
-	fmt.Printf("  Phone: %s\n", orNotFound(business.Phone))
-	fmt.Printf("  Website: %s\n", orNotFound(business.Website))
+	fmt.Fprintln(out, "\nExtracted information:")
+	fmt.Fprintf(out, "  Name: %s\n", orNotFound(business.Name))
+	fmt.Fprintf(out, "  Address: %s\n", orNotFound(business.Address))
+	fmt.Fprintf(out, "  Phone: %s\n", orNotFound(business.Phone))
+	fmt.Fprintf(out, "  Website: %s\n", orNotFound(business.Website))
 
 	if hoursClean != "" {
-		fmt.Printf("  Hours: %s\n", hoursClean)
+		fmt.Fprintf(out, "  Hours: %s\n", hoursClean)
 	} else if business.Hours != "" {
-		fmt.Printf("  Hours (raw): %s\n", business.Hours)
+		fmt.Fprintf(out, "  Hours (raw): %s\n", business.Hours)
 	} else {
-		fmt.Printf("  Hours: (not found)\n")
+		fmt.Fprintf(out, "  Hours: (not found)\n")
 	}
 
-	fmt.Printf("  Photo: %s\n", orNotFound(business.PhotoURL))
+	fmt.Fprintf(out, "  Photo: %s\n", orNotFound(business.PhotoURL))
 	if business.Latitude != "" && business.Longitude != "" {
-		fmt.Printf("  Location: %s, %s\n", business.Latitude, business.Longitude)
+		fmt.Fprintf(out, "  Location: %s, %s\n", business.Latitude, business.Longitude)
 	}
 }
 
@@ -138,64 +261,53 @@ func orNotFound(s string) string {
 	return s
 }
 
-func generateVCard(business *scraper.BusinessData, hoursClean, photoBase64 string) string {
-	card := make(vcard.Card)
+// vcardEscaper escapes TEXT values per RFC 2426 (backslash, comma, semicolon, newline)
+var vcardEscaper = strings.NewReplacer(`\`, `\\`, ",", `\,`, ";", `\;`, "\n", `\n`)
 
-	// Version (required)
-	card.SetValue(vcard.FieldVersion, "3.0")
+// writeVCard writes vCard 3.0 directly to w - the schema is fixed, no card object needed
+func writeVCard(w io.Writer, business *scraper.BusinessData, hoursClean, photoBase64 string) error {
+	b := bufio.NewWriter(w)
+	line := func(parts ...string) {
+		for _, part := range parts {
+			b.WriteString(part)
+		}
+		b.WriteString("\r\n")
+	}
 
-	// Required: Full name
-	card.SetValue(vcard.FieldFormattedName, business.Name)
+	line("BEGIN:VCARD")
+	line("VERSION:3.0")
 
-	// Name structure (empty for organizations)
-	card.Set(vcard.FieldName, &vcard.Field{
-		Value: ";;;;",
-	})
+	// Required: Full name + name structure (empty for organizations)
+	name := vcardEscaper.Replace(business.Name)
+	line("FN:", name)
+	line("N:;;;;")
 
 	// Organization
-	card.SetValue(vcard.FieldOrganization, business.Name)
+	line("ORG:", name)
 
 	// Address
 	if business.Address != "" {
-		card.Set(vcard.FieldAddress, &vcard.Field{
-			Value: ";;" + business.Address + ";;;;",
-			Params: vcard.Params{
-				vcard.ParamType: []string{"WORK"},
-			},
-		})
+		line("ADR;TYPE=WORK:;;", vcardEscaper.Replace(business.Address), ";;;;")
 	}
 
 	// Phone
 	if business.Phone != "" {
-		card.Add(vcard.FieldTelephone, &vcard.Field{
-			Value:  business.Phone,
-			Params: vcard.Params{vcard.ParamType: []string{"WORK"}},
-		})
+		line("TEL;TYPE=WORK:", vcardEscaper.Replace(business.Phone))
 	}
 
-	// Website
+	// Website (URI value - not TEXT-escaped)
 	if business.Website != "" {
-		card.Add(vcard.FieldURL, &vcard.Field{
-			Value:  business.Website,
-			Params: vcard.Params{vcard.ParamType: []string{"WORK"}},
-		})
+		line("URL;TYPE=WORK:", business.Website)
 	}
 
 	// Geo coordinates
 	if business.Latitude != "" && business.Longitude != "" {
-		geoValue := fmt.Sprintf("%s;%s", business.Latitude, business.Longitude)
-		card.Set("GEO", &vcard.Field{Value: geoValue})
+		line("GEO:", business.Latitude, ";", business.Longitude)
 	}
 
 	// Business photo
 	if photoBase64 != "" {
-		card.Add(vcard.FieldPhoto, &vcard.Field{
-			Value: photoBase64,
-			Params: vcard.Params{
-				"ENCODING": []string{"b"},
-				"TYPE":     []string{"JPEG"},
-			},
-		})
+		line("PHOTO;ENCODING=b;TYPE=JPEG:", photoBase64)
 	}
 
 	// Note field: business hours + creation date
@@ -208,16 +320,10 @@ func generateVCard(business *scraper.BusinessData, hoursClean, photoBase64 strin
 		noteLines = append(noteLines, "Hours: "+hoursToUse)
 	}
 	noteLines = append(noteLines, "Added: "+time.Now().Format("2006-01-02"))
-	card.Set(vcard.FieldNote, &vcard.Field{
-		Value: strings.Join(noteLines, "\\n"),
-	})
+	line("NOTE:", vcardEscaper.Replace(strings.Join(noteLines, "\n")))
 
-	// Encode to string
-	var buf strings.Builder
-	enc := vcard.NewEncoder(&buf)
-	if err := enc.Encode(card); err != nil {
-		log.Printf("Warning: vCard encoding error: %v", err)
-	}
+	line("END:VCARD")
 
-	return buf.String()
+	// bufio.Writer keeps the first write error, Flush reports it
+	return b.Flush()
 }
@@ -0,0 +1,220 @@
+package main
+
+import (
+	"strings"
+	"sync"
+	"sync/atomic"
+	"testing"
+	"time"
+
+	"gmaps2vcard/scraper"
+)
+
+func TestIsValidGoogleMapsURL(t *testing.T) {
+	tests := []struct {
+		url  string
+		want bool
+	}{
+		{"https://share.google/w4UZTre3NvPyC3b3Q", true},
+		{"https://www.google.com/maps/place/Eiffel+Tower/@48.8583701,2.2944813,17z", true},
+		{"http://maps.google.com/?cid=123", true},
+		{"https://goo.gl/maps/xyz123", true},
+		{"https://maps.app.goo.gl/xyz123", true},
+		{"HTTPS://SHARE.GOOGLE/abc", true},
+		{"https://www.google.com:443/maps", true},
+		{"https://user@www.google.com/maps", true},
+
+		// Look-alike hosts
+		{"https://notgoogle.com/maps", false},
+		{"https://google.com.evil.com/maps", false},
+		{"https://evil.com/www.google.com", false},
+		{"https://evil.com?www.google.com", false},
+		{"https://evil.com#www.google.com", false},
+		{`https://evil.com\.google.com/`, false},
+
+		// Userinfo / escaping tricks
+		{"https://www.google.com@evil.com/maps", false},
+		{`https://evil.com\@www.google.com/maps`, false},
+		{"https://evil.com%40www.google.com/", false},
+
+		// Ports
+		{"https://www.google.com:abc/maps", false},
+		{"https://evil.com:443.google.com/", false},
+
+		// Scheme
+		{"ftp://www.google.com/maps", false},
+		{"www.google.com/maps", false},
+		{"https://", false},
+		{"", false},
+	}
+
+	for _, tt := range tests {
+		if got := isValidGoogleMapsURL(tt.url); got != tt.want {
+			t.Errorf("isValidGoogleMapsURL(%q) = %v, want %v", tt.url, got, tt.want)
+		}
+	}
+}
+
+func TestVCardEscaper(t *testing.T) {
+	tests := []struct {
+		in   string
+		want string
+	}{
+		{"Plain Name", "Plain Name"},
+		{"Bar; Grill", `Bar\; Grill`},
+		{"Calle Mayor, 1", `Calle Mayor\, 1`},
+		{`C:\path`, `C:\\path`},
+		{"line1\nline2", `line1\nline2`},
+		{`a\,b`, `a\\\,b`}, // the backslash is doubled and the comma escaped once
+		{"", ""},
+	}
+
+	for _, tt := range tests {
+		if got := vcardEscaper.Replace(tt.in); got != tt.want {
+			t.Errorf("vcardEscaper.Replace(%q) = %q, want %q", tt.in, got, tt.want)
+		}
+	}
+}
+
+func TestWriteVCard(t *testing.T) {
+	business := &scraper.BusinessData{
+		Name:      "Café; Bar, Grill",
+		Address:   "Calle Mayor, 1\nMadrid",
+		Phone:     "+34 910 00 00 00",
+		Website:   "https://example.com/a,b;c",
+		Latitude:  "40.4168",
+		Longitude: "-3.7038",
+	}
+
+	var b strings.Builder
+	if err := writeVCard(&b, business, "Mon-Fri 09:00-17:00; Sat-Sun Closed", "QUJD"); err != nil {
+		t.Fatalf("writeVCard: %v", err)
+	}
+
+	want := strings.Join([]string{
+		"BEGIN:VCARD",
+		"VERSION:3.0",
+		`FN:Café\; Bar\, Grill`,
+		"N:;;;;",
+		`ORG:Café\; Bar\, Grill`,
+		`ADR;TYPE=WORK:;;Calle Mayor\, 1\nMadrid;;;;`,
+		"TEL;TYPE=WORK:+34 910 00 00 00",
+		"URL;TYPE=WORK:https://example.com/a,b;c", // URI value, not TEXT-escaped
+		"GEO:40.4168;-3.7038",
+		"PHOTO;ENCODING=b;TYPE=JPEG:QUJD",
+		`NOTE:Hours: Mon-Fri 09:00-17:00\; Sat-Sun Closed\nAdded: ` + time.Now().Format("2006-01-02"),
+		"END:VCARD",
+		"",
+	}, "\r\n")
+
+	if got := b.String(); got != want {
+		t.Errorf("writeVCard() =\n%s\nwant\n%s", got, want)
+	}
+}
+
+func TestWriteVCardOmitsEmptyFields(t *testing.T) {
+	var b strings.Builder
+	if err := writeVCard(&b, &scraper.BusinessData{Name: "Only Name"}, "", ""); err != nil {
+		t.Fatalf("writeVCard: %v", err)
+	}
+
+	for _, prop := range []string{"ADR", "TEL", "URL", "GEO", "PHOTO", "Hours:"} {
+		if strings.Contains(b.String(), prop) {
+			t.Errorf("writeVCard() with no %s data wrote it:\n%s", prop, b.String())
+		}
+	}
+}
+
+func TestClaimFilename(t *testing.T) {
+	claimedMu.Lock()
+	claimed = map[string]bool{}
+	claimedMu.Unlock()
+
+	tests := []struct {
+		filename string
+		want     string
+	}{
+		{"Café Central.vcf", "Café Central.vcf"},
+		{"Café Central.vcf", "Café Central (2).vcf"},
+		{"CAFÉ CENTRAL.vcf", "CAFÉ CENTRAL (3).vcf"}, // same file on case-insensitive filesystems
+		{"Café Central.vcf", "Café Central (4).vcf"},
+		{"Other.vcf", "Other.vcf"},
+	}
+
+	for _, tt := range tests {
+		if got := claimFilename(tt.filename); got != tt.want {
+			t.Errorf("claimFilename(%q) = %q, want %q", tt.filename, got, tt.want)
+		}
+	}
+}
+
+func TestForEachLimited(t *testing.T) {
+	const n, limit = 20, 3
+
+	var inFlight, peak atomic.Int32
+	var mu sync.Mutex
+	done := map[int]bool{}
+
+	forEachLimited(n, limit, func(i int) {
+		now := inFlight.Add(1)
+		defer inFlight.Add(-1)
+		for {
+			p := peak.Load()
+			if now <= p || peak.CompareAndSwap(p, now) {
+				break
+			}
+		}
+		time.Sleep(5 * time.Millisecond)
+
+		mu.Lock()
+		done[i] = true
+		mu.Unlock()
+	})
+
+	if p := peak.Load(); p > limit {
+		t.Errorf("%d calls in flight, want at most %d", p, limit)
+	}
+	if len(done) != n {
+		t.Errorf("%d of %d calls ran", len(done), n)
+	}
+}
+
+func TestPlaceKey(t *testing.T) {
+	tests := []struct {
+		name     string
+		a, b     string
+		wantSame bool
+	}{
+		{
+			name:     "same feature ID, different viewport",
+			a:        "https://www.google.com/maps/place/Cafe/@40.4168,-3.7038,17z/data=!4m6!3m5!1s0xd42287e472b3b8f:0x6a4f71889b5d0a2!8m2",
+			b:        "https://www.google.com/maps/place/Cafe/@40.4170,-3.7040,15z/data=!4m6!3m5!1s0xd42287e472b3b8f:0x6a4f71889b5d0a2!8m2",
+			wantSame: true,
+		},
+		{
+			name:     "same name, different feature IDs",
+			a:        "https://www.google.com/maps/place/Cafe/@40.4168,-3.7038,17z/data=!1s0xd42287e472b3b8f:0x6a4f71889b5d0a2",
+			b:        "https://www.google.com/maps/place/Cafe/@41.3874,2.1686,17z/data=!1s0x12a4a2f8a4b0c0d1:0x1b2c3d4e5f60718",
+			wantSame: false,
+		},
+		{
+			name:     "no feature ID, identical URLs",
+			a:        "https://www.google.com/maps/place/Cafe/@40.4168,-3.7038,17z",
+			b:        "https://www.google.com/maps/place/Cafe/@40.4168,-3.7038,17z",
+			wantSame: true,
+		},
+		{
+			name:     "no feature ID, different viewport stays separate",
+			a:        "https://www.google.com/maps/place/Cafe/@40.4168,-3.7038,17z",
+			b:        "https://www.google.com/maps/place/Cafe/@40.4168,-3.7038,15z",
+			wantSame: false,
+		},
+	}
+
+	for _, tt := range tests {
+		ka, kb := placeKey(tt.a), placeKey(tt.b)
+		if (ka == kb) != tt.wantSame {
+			t.Errorf("%s: placeKey() = %q and %q, want same=%v", tt.name, ka, kb, tt.wantSame)
+		}
+	}
+}
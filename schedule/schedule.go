@@ -5,6 +5,7 @@ import (
 	"log"
 	"regexp"
 	"sort"
+	"strconv"
 	"strings"
 )
 
@@ -53,6 +54,55 @@ type WeekSchedule struct {
 	Days [7]DaySchedule
 }
 
+// charNormalizer maps dashes and special whitespace to plain ASCII
+// strings.Replacer matches all keys in a single scan instead of one ReplaceAll pass each
+var charNormalizer = strings.NewReplacer(
+	"\u2013", "-", // en-dash
+	"\u2014", "-", // em-dash
+	"\u202f", " ", // narrow no-break space
+	"\u00a0", " ", // non-breaking space
+	"\t", " ",
+	"\r", "",
+	"\n", " ",
+)
+
+// dayTranslator translates (lowercased) Spanish day names and "cerrado"
+var dayTranslator = strings.NewReplacer(
+	"lunes", "monday",
+	"martes", "tuesday",
+	"miércoles", "wednesday",
+	"miercoles", "wednesday", // without accent
+	"jueves", "thursday",
+	"viernes", "friday",
+	"sábado", "saturday",
+	"sabado", "saturday", // without accent
+	"domingo", "sunday",
+	"cerrado", "closed",
+)
+
+// Precompiled patterns (compiled once at package init, not per call)
+var (
+	spaceRunRe = regexp.MustCompile(` +`)
+
+	// "de 8:00 a 13:00" → "8:00-13:00"
+	spanishTimeRe = regexp.MustCompile(`de\s+(\d{1,2}:\d{2})\s+a\s+(\d{1,2}:\d{2})`)
+
+	// "3 to 7 pm" (first time inherits am/pm from the second)
+	inferredAMPMRe = regexp.MustCompile(`(\d{1,2})(?::(\d{2}))?\s+to\s+(\d{1,2})(?::(\d{2}))?\s*(am|pm)`)
+
+	// "8 am", "8am", "8:00 am", "8:00am"
+	ampmTimeRe = regexp.MustCompile(`(\d{1,2})(?::(\d{2}))?\s*(am|pm)`)
+
+	// "08:00 to 13:00"
+	toSeparatorRe = regexp.MustCompile(`(\d{1,2}:\d{2})\s+to\s+(\d{1,2}:\d{2})`)
+
+	// "08:00-13:00"
+	timeRangeRe = regexp.MustCompile(`(\d{1,2}:\d{2})\s*-\s*(\d{1,2}:\d{2})`)
+
+	// English day names (after translation)
+	dayNameRe = regexp.MustCompile(`monday|tuesday|wednesday|thursday|friday|saturday|sunday`)
+)
+
 // Parse extracts structured schedule from raw text
 func Parse(rawText string, debug bool) (*WeekSchedule, error) {
 	if debug {
@@ -105,48 +155,15 @@ func normalizeText(text string, debug bool) string {
 		log.Printf("[DEBUG] Normalizing text...")
 	}
 
-	// Remove special Unicode characters (en-dash, em-dash → hyphen)
-	text = strings.ReplaceAll(text, "–", "-")
-	text = strings.ReplaceAll(text, "—", "-")
-	text = strings.ReplaceAll(text, "\u2013", "-") // en-dash
-	text = strings.ReplaceAll(text, "\u2014", "-") // em-dash
-
-	// Normalize special space characters to regular space
-	text = strings.ReplaceAll(text, "\u202f", " ") // narrow no-break space
-	text = strings.ReplaceAll(text, "\u00a0", " ") // non-breaking space
-
-	// Normalize whitespace
-	text = strings.ReplaceAll(text, "\t", " ")
-	text = strings.ReplaceAll(text, "\r", "")
-	text = regexp.MustCompile(` +`).ReplaceAllString(text, " ")
-
-	// Remove newlines (everything on one line for easier parsing)
-	text = strings.ReplaceAll(text, "\n", " ")
-
-	// Translate Spanish day names to English
-	dayTranslations := map[string]string{
-		"lunes":     "monday",
-		"martes":    "tuesday",
-		"miércoles": "wednesday",
-		"miercoles": "wednesday", // without accent
-		"jueves":    "thursday",
-		"viernes":   "friday",
-		"sábado":    "saturday",
-		"sabado":    "saturday", // without accent
-		"domingo":   "sunday",
-	}
+	// Dashes, special spaces, tabs, CR and newlines in ONE pass (everything on one line)
+	text = charNormalizer.Replace(text)
+	text = spaceRunRe.ReplaceAllString(text, " ")
 
-	lower := strings.ToLower(text)
-	for spanish, english := range dayTranslations {
-		lower = strings.ReplaceAll(lower, spanish, english)
-	}
-
-	// Also handle "closed" / "cerrado"
-	lower = strings.ReplaceAll(lower, "cerrado", "closed")
+	// Spanish day names + "cerrado" → English in ONE pass
+	lower := dayTranslator.Replace(strings.ToLower(text))
 
 	// Convert Spanish time format "De HH:MM a HH:MM" to "HH:MM-HH:MM"
 	// Pattern: "de 8:00 a 13:00" → "8:00-13:00"
-	spanishTimeRe := regexp.MustCompile(`de\s+(\d{1,2}:\d{2})\s+a\s+(\d{1,2}:\d{2})`)
 	lower = spanishTimeRe.ReplaceAllString(lower, "$1-$2")
 
 	// Convert English AM/PM format to 24h
@@ -164,13 +181,7 @@ func normalizeText(text string, debug bool) string {
 func convertAMPMTo24h(text string, debug bool) string {
 	// Handle "X to Y pm" where X has no am/pm marker (infer from Y)
 	// Pattern: "3 to 7 pm" → "15:00 to 19:00"
-	inferredRe := regexp.MustCompile(`(\d{1,2})(?::(\d{2}))?\s+to\s+(\d{1,2})(?::(\d{2}))?\s*(am|pm)`)
-	text = inferredRe.ReplaceAllStringFunc(text, func(match string) string {
-		parts := inferredRe.FindStringSubmatch(match)
-		if len(parts) < 6 {
-			return match
-		}
-
+	text = replaceSubmatches(inferredAMPMRe, text, func(parts []string) string {
 		hour1 := parts[1]
 		min1 := parts[2]
 		if min1 == "" {
@@ -183,9 +194,9 @@ func convertAMPMTo24h(text string, debug bool) string {
 		}
 		ampm := parts[5]
 
-		h1, h2 := 0, 0
-		fmt.Sscanf(hour1, "%d", &h1)
-		fmt.Sscanf(hour2, "%d", &h2)
+		// Regex guarantees 1-2 digits, Atoi cannot fail
+		h1, _ := strconv.Atoi(hour1)
+		h2, _ := strconv.Atoi(hour2)
 
 		// Apply am/pm to both times (infer first from second)
 		if ampm == "pm" {
@@ -207,16 +218,8 @@ func convertAMPMTo24h(text string, debug bool) string {
 		return fmt.Sprintf("%02d:%s to %02d:%s", h1, min1, h2, min2)
 	})
 
-	// Match patterns like "8 am", "8am", "8:00 am", "8:00am"
-	ampmTimeRe := regexp.MustCompile(`(\d{1,2})(?::(\d{2}))?\s*(am|pm)`)
-
 	// Convert remaining AM/PM times to 24h format
-	text = ampmTimeRe.ReplaceAllStringFunc(text, func(match string) string {
-		parts := ampmTimeRe.FindStringSubmatch(match)
-		if len(parts) < 4 {
-			return match
-		}
-
+	text = replaceSubmatches(ampmTimeRe, text, func(parts []string) string {
 		hour := parts[1]
 		minute := parts[2]
 		if minute == "" {
@@ -224,8 +227,7 @@ func convertAMPMTo24h(text string, debug bool) string {
 		}
 		ampm := parts[3]
 
-		hourNum := 0
-		fmt.Sscanf(hour, "%d", &hourNum)
+		hourNum, _ := strconv.Atoi(hour)
 
 		if ampm == "pm" && hourNum != 12 {
 			hourNum += 12
@@ -238,12 +240,39 @@ func convertAMPMTo24h(text string, debug bool) string {
 
 	// Convert "to" separator to hyphen for time ranges
 	// Pattern: "08:00 to 13:00" → "08:00-13:00"
-	toSeparatorRe := regexp.MustCompile(`(\d{1,2}:\d{2})\s+to\s+(\d{1,2}:\d{2})`)
 	text = toSeparatorRe.ReplaceAllString(text, "$1-$2")
 
 	return text
 }
 
+// replaceSubmatches replaces every match of re with repl(submatches) in ONE matching pass
+// (ReplaceAllStringFunc only passes the match text, forcing a second FindStringSubmatch per match)
+func replaceSubmatches(re *regexp.Regexp, text string, repl func(parts []string) string) string {
+	matches := re.FindAllStringSubmatchIndex(text, -1)
+	if len(matches) == 0 {
+		return text
+	}
+
+	var b strings.Builder
+	b.Grow(len(text))
+	last := 0
+	for _, m := range matches {
+		parts := make([]string, len(m)/2)
+		for i := range parts {
+			if m[2*i] >= 0 {
+				parts[i] = text[m[2*i]:m[2*i+1]]
+			}
+		}
+
+		b.WriteString(text[last:m[0]])
+		b.WriteString(repl(parts))
+		last = m[1]
+	}
+	b.WriteString(text[last:])
+
+	return b.String()
+}
+
 // parseScheduleText extracts day -> time ranges mapping
 func parseScheduleText(text string, debug bool) map[string][]TimeRange {
 	result := make(map[string][]TimeRange)
@@ -257,30 +286,36 @@ func parseScheduleText(text string, debug bool) map[string][]TimeRange {
 
 	days := []string{"monday", "tuesday", "wednesday", "thursday", "friday", "saturday", "sunday"}
 
+	// Locate every day name in ONE scan (instead of rescanning the text for each day pair)
+	occurrences := dayNameRe.FindAllStringIndex(text, -1)
+	firstOccurrence := make(map[string]int, len(days))
+	for i, o := range occurrences {
+		name := text[o[0]:o[1]]
+		if _, seen := firstOccurrence[name]; !seen {
+			firstOccurrence[name] = i
+		}
+	}
+
 	for _, day := range days {
 		// Find the day in the text
-		dayIdx := strings.Index(text, day)
-		if dayIdx == -1 {
+		k, found := firstOccurrence[day]
+		if !found {
 			if debug {
 				log.Printf("[DEBUG] Day %s not found in text", day)
 			}
 			continue
 		}
 
-		// Extract everything after the day name until the next day or end
-		afterDay := text[dayIdx+len(day):]
-
-		// Find where the next day starts
-		nextDayIdx := len(afterDay)
-		for _, otherDay := range days {
-			if otherDay != day {
-				if idx := strings.Index(afterDay, otherDay); idx != -1 && idx < nextDayIdx {
-					nextDayIdx = idx
-				}
+		// Extract everything after the day name until the next (different) day or end
+		end := len(text)
+		for _, o := range occurrences[k+1:] {
+			if text[o[0]:o[1]] != day {
+				end = o[0]
+				break
 			}
 		}
 
-		dayContent := strings.TrimSpace(afterDay[:nextDayIdx])
+		dayContent := strings.TrimSpace(text[occurrences[k][1]:end])
 
 		if debug {
 			log.Printf("[DEBUG] %s content: %q", day, dayContent)
@@ -296,8 +331,7 @@ func parseScheduleText(text string, debug bool) map[string][]TimeRange {
 		}
 
 		// Extract time ranges (format: HH:MM-HH:MM)
-		timeRegex := regexp.MustCompile(`(\d{1,2}:\d{2})\s*-\s*(\d{1,2}:\d{2})`)
-		matches := timeRegex.FindAllStringSubmatch(dayContent, -1)
+		matches := timeRangeRe.FindAllStringSubmatch(dayContent, -1)
 
 		if len(matches) > 0 {
 			ranges := make([]TimeRange, 0, len(matches))
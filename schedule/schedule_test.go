@@ -0,0 +1,59 @@
+package schedule
+
+import "testing"
+
+func TestParseFormat(t *testing.T) {
+	tests := []struct {
+		name string
+		text string
+		want string
+	}{
+		{
+			name: "spanish table rows",
+			text: "lunes: De 8:00 a 13:00, De 15:00 a 18:00\nmartes: De 8:00 a 13:00, De 15:00 a 18:00\nmiércoles: De 8:00 a 13:00\njueves: De 8:00 a 13:00\nviernes: De 8:00 a 13:00\nsábado: Cerrado\ndomingo: Cerrado",
+			want: "Mon-Tue 08:00-13:00, 15:00-18:00; Wed-Fri 08:00-13:00; Sat-Sun Closed",
+		},
+		{
+			name: "unaccented spanish, mixed separators and narrow no-break spaces",
+			text: "Lunes\t9:00–14:00\r\nMartes  9:00–14:00\nMiercoles 9:00-14:00\nJueves 9:00\u202f-\u202f14:00\nViernes 3 to 7 pm\nSabado cerrado\nDomingo cerrado",
+			want: "Mon-Thu 09:00-14:00; Fri 15:00-19:00; Sat-Sun Closed",
+		},
+		{
+			name: "one line, am/pm inferred",
+			text: "Sunday Closed Monday 12 am to 12 pm Tuesday 11:30am to 2:30pm Wednesday 7–11 AM",
+			want: "Mon 00:00-12:00; Tue 11:30-14:30; Wed-Sun Closed",
+		},
+		{
+			name: "repeated day: first occurrence runs to the next different day",
+			text: "monday 9:00-10:00 monday again 11:00-12:00 tuesday closed friday 1 pm to 3 pm wednesday 8:00-9:00 monday 13:00-14:00",
+			want: "Mon 09:00-10:00, 11:00-12:00; Tue Closed; Wed 08:00-09:00; Thu Closed; Fri 13:00-15:00; Sat-Sun Closed",
+		},
+		{
+			name: "repeated day after adjacent day names",
+			text: "sundaymonday 9:00-10:00 sunday 10:00-11:00",
+			want: "Mon 09:00-10:00; Tue-Sun Closed",
+		},
+		{
+			name: "empty",
+			text: "",
+			want: "Mon-Sun Closed",
+		},
+		{
+			name: "no day names",
+			text: "Horas\nsomething random",
+			want: "Mon-Sun Closed",
+		},
+	}
+
+	for _, tt := range tests {
+		t.Run(tt.name, func(t *testing.T) {
+			ws, err := Parse(tt.text, false)
+			if err != nil {
+				t.Fatalf("Parse: %v", err)
+			}
+			if got := ws.Format(false); got != tt.want {
+				t.Errorf("Format() = %q, want %q", got, tt.want)
+			}
+		})
+	}
+}
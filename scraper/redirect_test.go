@@ -0,0 +1,192 @@
+package scraper
+
+import (
+	"context"
+	"net"
+	"net/http"
+	"net/http/httptest"
+	"strconv"
+	"strings"
+	"testing"
+
+	"gmaps2vcard/httpclient"
+)
+
+// fakeGoogle answers every host (share.google, www.google.com, ...) from one local
+// server, so redirect walks run without network access; routes are keyed by host+path
+func fakeGoogle(t *testing.T, handler http.HandlerFunc) {
+	t.Helper()
+
+	srv := httptest.NewServer(handler)
+	t.Cleanup(srv.Close)
+
+	transport := &http.Transport{
+		DialContext: func(ctx context.Context, network, _ string) (net.Conn, error) {
+			return (&net.Dialer{}).DialContext(ctx, network, srv.Listener.Addr().String())
+		},
+	}
+	t.Cleanup(transport.CloseIdleConnections)
+
+	saved := httpclient.NoRedirectClient.Transport
+	httpclient.NoRedirectClient.Transport = transport
+	t.Cleanup(func() { httpclient.NoRedirectClient.Transport = saved })
+}
+
+// isolateCache points the on-disk caches at a temp dir (before their first use)
+func isolateCache(t *testing.T) {
+	t.Helper()
+	dir := t.TempDir()
+	t.Setenv("XDG_CACHE_HOME", dir)
+	t.Setenv("HOME", dir)
+}
+
+func TestFollowRedirects(t *testing.T) {
+	var methods []string
+
+	fakeGoogle(t, func(w http.ResponseWriter, r *http.Request) {
+		route := r.Host + r.URL.Path
+		methods = append(methods, r.Method+" "+route)
+
+		switch {
+		case route == "share.google/direct":
+			http.Redirect(w, r, "https://www.google.com/maps/place/Direct/@1.5,2.5,17z", http.StatusFound)
+		case route == "share.google/hop":
+			http.Redirect(w, r, "http://www.google.com/redir", http.StatusMovedPermanently)
+		case route == "www.google.com/redir":
+			// Relative to the current hop
+			http.Redirect(w, r, "/maps/place/Relative", http.StatusFound)
+		case route == "share.google/headless":
+			if r.Method == http.MethodHead {
+				w.WriteHeader(http.StatusMethodNotAllowed)
+				return
+			}
+			http.Redirect(w, r, "https://www.google.com/maps/place/ViaGet", http.StatusFound)
+		case route == "share.google/blocked":
+			w.WriteHeader(http.StatusForbidden)
+		case route == "share.google/dead":
+			w.WriteHeader(http.StatusOK)
+		case route == "www.google.com/landing":
+			w.WriteHeader(http.StatusOK)
+		case strings.HasPrefix(route, "share.google/loop/"):
+			n, _ := strconv.Atoi(strings.TrimPrefix(route, "share.google/loop/"))
+			http.Redirect(w, r, "/loop/"+strconv.Itoa(n+1), http.StatusFound)
+		case route == "share.google/consent":
+			http.Redirect(w, r, "https://consent.google.com/ml?continue=https://www.google.com/maps/place/Consented%3Fhl%3Den&gl=ES#x", http.StatusFound)
+		default:
+			t.Errorf("unexpected request: %s %s", r.Method, route)
+			w.WriteHeader(http.StatusNotFound)
+		}
+	})
+
+	tests := []struct {
+		name     string
+		url      string
+		want     string
+		wantErr  string
+		requests []string // every request the walk should send, in order
+	}{
+		{
+			name:     "stops at the first classifiable URL without fetching it",
+			url:      "http://share.google/direct",
+			want:     "https://www.google.com/maps/place/Direct/@1.5,2.5,17z",
+			requests: []string{"HEAD share.google/direct"},
+		},
+		{
+			name:     "relative Location",
+			url:      "http://share.google/hop",
+			want:     "http://www.google.com/maps/place/Relative",
+			requests: []string{"HEAD share.google/hop", "HEAD www.google.com/redir"},
+		},
+		{
+			name:     "405 falls back to GET",
+			url:      "http://share.google/headless",
+			want:     "https://www.google.com/maps/place/ViaGet",
+			requests: []string{"HEAD share.google/headless", "GET share.google/headless"},
+		},
+		{
+			name:     "4xx hop is an error",
+			url:      "http://share.google/blocked",
+			wantErr:  "403 Forbidden",
+			requests: []string{"HEAD share.google/blocked"},
+		},
+		{
+			name:     "short link that does not redirect",
+			url:      "http://share.google/dead",
+			wantErr:  "did not redirect",
+			requests: []string{"HEAD share.google/dead"},
+		},
+		{
+			name:     "other Google URL that does not redirect ends there",
+			url:      "http://www.google.com/landing",
+			want:     "http://www.google.com/landing",
+			requests: []string{"HEAD www.google.com/landing"},
+		},
+		{
+			name:    "hop cap",
+			url:     "http://share.google/loop/0",
+			wantErr: "stopped after 5 redirects",
+			requests: []string{
+				"HEAD share.google/loop/0", "HEAD share.google/loop/1", "HEAD share.google/loop/2",
+				"HEAD share.google/loop/3", "HEAD share.google/loop/4",
+			},
+		},
+		{
+			name:     "consent page is unwrapped, not fetched",
+			url:      "http://share.google/consent",
+			want:     "https://www.google.com/maps/place/Consented?hl=en",
+			requests: []string{"HEAD share.google/consent"},
+		},
+	}
+
+	for _, tt := range tests {
+		t.Run(tt.name, func(t *testing.T) {
+			methods = nil
+
+			got, err := followRedirects(tt.url)
+			switch {
+			case tt.wantErr != "":
+				if err == nil || !strings.Contains(err.Error(), tt.wantErr) {
+					t.Errorf("followRedirects(%q) error = %v, want it to contain %q", tt.url, err, tt.wantErr)
+				}
+			case err != nil:
+				t.Errorf("followRedirects(%q) error = %v", tt.url, err)
+			case got != tt.want:
+				t.Errorf("followRedirects(%q) = %q, want %q", tt.url, got, tt.want)
+			}
+
+			if strings.Join(methods, ", ") != strings.Join(tt.requests, ", ") {
+				t.Errorf("requests = %q, want %q", methods, tt.requests)
+			}
+		})
+	}
+}
+
+func TestResolveCachesOnlyUsableDestinations(t *testing.T) {
+	isolateCache(t)
+
+	fakeGoogle(t, func(w http.ResponseWriter, r *http.Request) {
+		switch r.Host + r.URL.Path {
+		case "share.google/ok":
+			http.Redirect(w, r, "https://www.google.com/maps/place/Cached", http.StatusFound)
+		case "share.google/captcha":
+			http.Redirect(w, r, "https://www.google.com/sorry/index?continue=x", http.StatusFound)
+		default:
+			w.WriteHeader(http.StatusNotFound)
+		}
+	})
+
+	if _, err := Resolve("http://share.google/captcha"); err == nil || !strings.Contains(err.Error(), "CAPTCHA") {
+		t.Errorf("Resolve(captcha) error = %v, want CAPTCHA error", err)
+	}
+	var cached string
+	if redirectCache.Get("http://share.google/captcha", &cached) {
+		t.Errorf("/sorry/ destination was cached: %q", cached)
+	}
+
+	if _, err := Resolve("http://share.google/ok"); err != nil {
+		t.Fatalf("Resolve(ok) error = %v", err)
+	}
+	if !redirectCache.Get("http://share.google/ok", &cached) || cached != "https://www.google.com/maps/place/Cached" {
+		t.Errorf("usable destination not cached: %q", cached)
+	}
+}
@@ -2,14 +2,20 @@ package scraper
 
 import (
 	"context"
+	"encoding/json"
 	"fmt"
 	"log"
 	"net/http"
 	"net/url"
 	"regexp"
 	"strings"
+	"sync"
 	"time"
 
+	"gmaps2vcard/diskcache"
+	"gmaps2vcard/httpclient"
+
+	"github.com/chromedp/cdproto/page"
 	"github.com/chromedp/chromedp"
 )
 
@@ -25,10 +31,33 @@ type BusinessData struct {
 	Longitude string
 }
 
+// coordsRe matches "@lat,lng" in Maps URLs (compiled once at package init)
+var coordsRe = regexp.MustCompile(`@(-?\d+\.\d+),(-?\d+\.\d+)`)
+
+// redirectCache remembers short link → final URL across runs (short codes don't change)
+var redirectCache = diskcache.New("redirects", 7*24*time.Hour)
+
+// businessCache remembers resolved URL → extracted data (a scrape costs seconds)
+// Partial results may only be missing because a bounded wait timed out, so they expire sooner
+var (
+	businessCache      = diskcache.New("businesses", 30*24*time.Hour)
+	partialBusinessTTL = 24 * time.Hour
+)
+
+// Shared browser: launched once, reused by every Extract call (Chrome startup dominates per-URL cost)
+var (
+	browserOnce   sync.Once
+	browserCtx    context.Context
+	browserCancel context.CancelFunc
+	browserErr    error
+)
+
 // Config holds configuration for the scraper
 type Config struct {
-	Timeout  time.Duration
-	WaitTime time.Duration
+	Timeout  time.Duration // Whole extraction budget
+	WaitTime time.Duration // Max wait for optional page elements (not a fixed sleep)
+	Cache    bool          // Reuse/store extracted data in the on-disk cache
+	Refresh  bool          // Skip cached data but still store the fresh scrape (replaces stale entries)
 }
 
 // DefaultConfig returns sensible defaults
@@ -36,11 +65,13 @@ func DefaultConfig() *Config {
 	return &Config{
 		Timeout:  45 * time.Second,
 		WaitTime: 3 * time.Second,
+		Cache:    true,
 	}
 }
 
-// Extract extracts all business data from ANY Google Maps URL in ONE chromedp session
+// Extract extracts all business data from ANY Google Maps URL in ONE chromedp tab
 // Handles URL normalization, search page extraction, and business data scraping
+// The browser is shared across calls; call Close when done
 func Extract(inputURL string, config *Config) (*BusinessData, error) {
 	if config == nil {
 		config = DefaultConfig()
@@ -49,40 +80,45 @@ func Extract(inputURL string, config *Config) (*BusinessData, error) {
 	business := &BusinessData{}
 	log.Printf("[Scraper] Starting extraction from: %.80s...", inputURL)
 
-	// Step 1: Follow HTTP redirects (no chromedp needed)
-	log.Printf("[Scraper] Following redirects...")
-	finalURL, err := followRedirects(inputURL)
-	if err != nil {
-		return nil, fmt.Errorf("failed to follow redirects: %w", err)
+	// Step 1: Resolve the URL - locally when possible, otherwise over HTTP while
+	// the shared Chrome launches in the background
+	finalURL, ok := resolveLocal(inputURL)
+	if !ok {
+		go startBrowser()
+
+		resolved, err := Resolve(inputURL)
+		if err != nil {
+			return nil, err
+		}
+		finalURL = resolved
+	}
+
+	// Step 2: Cached extraction for this place? (no browser needed at all)
+	if config.Cache && !config.Refresh {
+		var cached BusinessData
+		if businessCache.Get(finalURL, &cached) {
+			log.Printf("[Scraper] ✓ Business data cached")
+			return &cached, nil
+		}
 	}
-	log.Printf("[Scraper] Redirected to: %.80s...", finalURL)
 
-	// Step 2: Parse URL and check type
+	// Step 3: Parse URL and check type
 	u, err := url.Parse(finalURL)
 	if err != nil {
 		return nil, fmt.Errorf("failed to parse URL: %w", err)
 	}
 
 	// Extract coordinates from URL (works for any URL format)
-	coordsRe := regexp.MustCompile(`@(-?\d+\.\d+),(-?\d+\.\d+)`)
-	if matches := coordsRe.FindStringSubmatch(finalURL); len(matches) == 3 {
-		business.Latitude = matches[1]
-		business.Longitude = matches[2]
-	}
-
-	// Step 3: Set up chromedp - ONE session for EVERYTHING
-	opts := append(chromedp.DefaultExecAllocatorOptions[:],
-		chromedp.UserAgent("Mozilla/5.0 (Macintosh; Intel Mac OS X 10_15_7) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/120.0.0.0 Safari/537.36"),
-		chromedp.Flag("disable-blink-features", "AutomationControlled"),
-		chromedp.Flag("exclude-switches", "enable-automation"),
-		chromedp.Flag("headless", true),
-		chromedp.WindowSize(1920, 1080),
-	)
+	setCoordinates(business, finalURL)
 
-	allocCtx, allocCancel := chromedp.NewExecAllocator(context.Background(), opts...)
-	defer allocCancel()
+	// Launches the browser, or waits for the background launch (no-op once it is up)
+	browserCtx, err := startBrowser()
+	if err != nil {
+		return nil, fmt.Errorf("failed to start browser: %w", err)
+	}
 
-	ctx, ctxCancel := chromedp.NewContext(allocCtx)
+	// Each extraction gets its own tab in the shared browser
+	ctx, ctxCancel := chromedp.NewContext(browserCtx)
 	defer ctxCancel()
 
 	timeoutCtx, timeoutCancel := context.WithTimeout(ctx, config.Timeout)
@@ -91,12 +127,12 @@ func Extract(inputURL string, config *Config) (*BusinessData, error) {
 	// Step 4: Handle URL type and navigate
 	var mapsPlaceURL string
 
-	if strings.Contains(u.Path, "/maps/place/") {
+	switch urlKind(u) {
+	case kindPlace:
 		// Already a maps/place URL - perfect!
 		log.Printf("[Scraper] Already a maps/place URL")
 		mapsPlaceURL = finalURL
-
-	} else if strings.Contains(u.Path, "/search") {
+	case kindSearch:
 		// Search page - need to extract maps/place link
 		log.Printf("[Scraper] Detected search page, extracting maps/place link...")
 		extractedURL, err := extractMapsPlaceFromSearch(timeoutCtx, finalURL, config)
@@ -106,12 +142,15 @@ func Extract(inputURL string, config *Config) (*BusinessData, error) {
 		mapsPlaceURL = extractedURL
 		log.Printf("[Scraper] Extracted maps/place URL: %.80s...", mapsPlaceURL)
 
-	} else if u.Query().Get("ftid") != "" || u.Query().Get("cid") != "" {
+		// Search URLs carry no coordinates, the extracted place link usually does
+		if business.Latitude == "" {
+			setCoordinates(business, mapsPlaceURL)
+		}
+	case kindPlaceID:
 		// Direct place ID URL (ftid or cid parameter) - chromedp will render the place page
 		log.Printf("[Scraper] Detected place ID URL (ftid/cid parameter)")
 		mapsPlaceURL = finalURL
-
-	} else {
+	default:
 		return nil, fmt.Errorf("unknown Google Maps URL type: %s", u.Path)
 	}
 
@@ -122,44 +161,187 @@ func Extract(inputURL string, config *Config) (*BusinessData, error) {
 		return nil, fmt.Errorf("failed to extract business data: %w", err)
 	}
 
+	if config.Cache {
+		cacheBusiness(finalURL, business)
+	}
+
 	log.Printf("[Scraper] ✓ Extraction complete")
 	return business, nil
 }
 
-// followRedirects follows all HTTP redirects and returns the final URL
-func followRedirects(inputURL string) (string, error) {
-	client := &http.Client{
-		CheckRedirect: func(req *http.Request, via []*http.Request) error {
-			return nil // Allow all redirects
-		},
-		Timeout: 10 * time.Second,
+// cacheBusiness stores a scrape for re-runs: complete results for the full TTL,
+// partial ones briefly, and nothing without name and address (the place panel never settled)
+func cacheBusiness(key string, business *BusinessData) {
+	switch {
+	case business.Name == "" || business.Address == "":
+		log.Printf("[Scraper] Incomplete result not cached")
+	case business.Phone == "" || business.Hours == "" || business.PhotoURL == "":
+		businessCache.SetTTL(key, business, partialBusinessTTL)
+	default:
+		businessCache.Set(key, business)
+	}
+}
+
+// startBrowser launches the shared Chrome once and returns its context
+// Safe to call concurrently - every caller waits for the same launch
+func startBrowser() (context.Context, error) {
+	browserOnce.Do(func() {
+		opts := append(chromedp.DefaultExecAllocatorOptions[:],
+			chromedp.UserAgent(httpclient.UserAgent),
+			chromedp.Flag("disable-blink-features", "AutomationControlled"),
+			chromedp.Flag("exclude-switches", "enable-automation"),
+			chromedp.Flag("headless", true),
+			chromedp.WindowSize(1920, 1080),
+		)
+
+		allocCtx, allocCancel := chromedp.NewExecAllocator(context.Background(), opts...)
+		ctx, ctxCancel := chromedp.NewContext(allocCtx)
+		browserCtx = ctx
+		browserCancel = func() {
+			ctxCancel()
+			allocCancel()
+		}
+
+		// First Run with no actions only starts the browser
+		browserErr = chromedp.Run(ctx)
+	})
+
+	return browserCtx, browserErr
+}
+
+// Close shuts down the shared browser (no-op if it was never started)
+// Call once when done extracting - later Extract calls will fail
+func Close() {
+	browserOnce.Do(func() {
+		browserErr = fmt.Errorf("browser closed")
+	})
+	if browserCancel != nil {
+		browserCancel()
+	}
+}
+
+// Resolve returns the URL a short link (or other redirecting Google URL) points to (cached on disk)
+// URLs Extract can classify (place, search, place ID) are returned unchanged without any network access
+func Resolve(inputURL string) (string, error) {
+	if finalURL, ok := resolveLocal(inputURL); ok {
+		return finalURL, nil
+	}
+
+	log.Printf("[Scraper] Following redirects...")
+	finalURL, err := followRedirects(inputURL)
+	if err != nil {
+		return "", fmt.Errorf("failed to follow redirects: %w", err)
+	}
+	log.Printf("[Scraper] Redirected to: %.80s...", finalURL)
+
+	// Only a usable destination is cached - a CAPTCHA or a hop that stopped redirecting
+	// is a transient failure and must not stick to the link for a week
+	if strings.Contains(finalURL, "/sorry/") {
+		return "", fmt.Errorf("Google CAPTCHA detected while following redirects - try again later")
+	}
+	if u, err := url.Parse(finalURL); err == nil && !isShortLink(finalURL) && urlKind(u) != kindUnknown {
+		redirectCache.Set(inputURL, finalURL)
+	}
+
+	return finalURL, nil
+}
+
+// resolveLocal resolves without network access: URLs Extract can classify as-is,
+// short links (and other redirecting hops) from the cache
+func resolveLocal(inputURL string) (string, bool) {
+	if isRedirectTarget(inputURL) {
+		return inputURL, true
+	}
+
+	var cached string
+	if redirectCache.Get(inputURL, &cached) {
+		log.Printf("[Scraper] Redirect cached: %.80s...", cached)
+		return cached, true
 	}
+	return "", false
+}
 
-	req, err := http.NewRequest("GET", inputURL, nil)
+// isShortLink reports whether a URL is a short link that needs HTTP resolution
+// Unlike other unclassified Google URLs, a short link is never where the chain ends
+func isShortLink(rawURL string) bool {
+	u, err := url.Parse(rawURL)
 	if err != nil {
-		return "", err
+		return false
 	}
 
-	// Legitimate browser headers
-	req.Header.Set("User-Agent", "Mozilla/5.0 (Macintosh; Intel Mac OS X 10_15_7) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/120.0.0.0 Safari/537.36")
-	req.Header.Set("Accept", "text/html,application/xhtml+xml,application/xml;q=0.9,image/avif,image/webp,image/apng,*/*;q=0.8")
-	req.Header.Set("Accept-Language", "en-US,en;q=0.9")
+	// Hosts are case-insensitive (the URL validator lowercases them too)
+	switch strings.ToLower(u.Hostname()) {
+	case "share.google", "goo.gl", "maps.app.goo.gl":
+		return true
+	}
+	return false
+}
+
+// URL kinds Extract knows how to scrape
+const (
+	kindUnknown = iota
+	kindPlace   // /maps/place/...
+	kindSearch  // Google search page with a place card
+	kindPlaceID // ftid or cid parameter
+)
+
+// urlKind classifies a full Google URL the way Extract handles it
+func urlKind(u *url.URL) int {
+	switch {
+	case strings.Contains(u.Path, "/maps/place/"):
+		return kindPlace
+	case strings.Contains(u.Path, "/search"):
+		return kindSearch
+	case queryParam(u.RawQuery, "ftid") != "" || queryParam(u.RawQuery, "cid") != "":
+		return kindPlaceID
+	}
+	return kindUnknown
+}
 
-	resp, err := client.Do(req)
+// isRedirectTarget reports whether the redirect walk can stop at rawURL: a URL Extract
+// can classify, the consent page (unwrapped below) or a CAPTCHA page (a dead end)
+// Intermediate Google hops (share.google?q=..., maps?q=...) are not - they redirect on
+func isRedirectTarget(rawURL string) bool {
+	if isShortLink(rawURL) {
+		return false
+	}
+	u, err := url.Parse(rawURL)
 	if err != nil {
-		return "", err
+		return false
+	}
+	if strings.EqualFold(u.Hostname(), "consent.google.com") || strings.HasPrefix(u.Path, "/sorry/") {
+		return true
 	}
-	defer resp.Body.Close()
+	return urlKind(u) != kindUnknown
+}
 
-	finalURL := resp.Request.URL.String()
+// followRedirects walks the redirect chain hop by hop (on the shared keep-alive client)
+// and stops at the first URL Extract can handle - that page is never fetched, chromedp loads it anyway
+func followRedirects(inputURL string) (string, error) {
+	finalURL := inputURL
+	for hop := 0; !isRedirectTarget(finalURL); hop++ {
+		if hop == httpclient.MaxRedirects {
+			return "", fmt.Errorf("stopped after %d redirects", httpclient.MaxRedirects)
+		}
 
-	// Handle Google consent page
-	if strings.Contains(finalURL, "consent.google.com") {
-		u, err := url.Parse(finalURL)
+		next, err := nextHop(finalURL)
 		if err != nil {
-			return finalURL, nil
+			return "", err
+		}
+		if next == nil {
+			if isShortLink(finalURL) {
+				return "", fmt.Errorf("%s did not redirect", finalURL)
+			}
+			break // Not a redirect - finalURL is where the link ends
 		}
-		if continueURL := u.Query().Get("continue"); continueURL != "" {
+		finalURL = next.String()
+	}
+
+	// Handle Google consent page
+	if strings.Contains(finalURL, "consent.google.com") {
+		_, rawQuery, _ := strings.Cut(finalURL, "?")
+		rawQuery, _, _ = strings.Cut(rawQuery, "#")
+		if continueURL := queryParam(rawQuery, "continue"); continueURL != "" {
 			return continueURL, nil
 		}
 	}
@@ -167,50 +349,144 @@ func followRedirects(inputURL string) (string, error) {
 	return finalURL, nil
 }
 
+// nextHop requests rawURL without following redirects and returns the Location target (nil if none)
+// HEAD first (no body transfer); GET only if the server rejects the method itself -
+// any other failure is returned immediately instead of paying a second timeout
+func nextHop(rawURL string) (*url.URL, error) {
+	resp, err := redirectRequest("HEAD", rawURL)
+	if err != nil {
+		return nil, err
+	}
+	if resp.StatusCode == http.StatusMethodNotAllowed || resp.StatusCode == http.StatusNotImplemented {
+		resp.Body.Close()
+		log.Printf("[Scraper] HEAD rejected (%s), retrying with GET", resp.Status)
+		resp, err = redirectRequest("GET", rawURL)
+		if err != nil {
+			return nil, err
+		}
+	}
+	// Body is never read - only the Location header matters
+	resp.Body.Close()
+
+	// A 403/429/5xx shell is a failed hop, not where the link ends
+	if resp.StatusCode >= 400 {
+		return nil, fmt.Errorf("%s answered %s", resp.Request.URL.Host, resp.Status)
+	}
+
+	location := resp.Header.Get("Location")
+	if resp.StatusCode < 300 || resp.StatusCode > 399 || location == "" {
+		return nil, nil
+	}
+
+	// Location may be relative to the current hop
+	return resp.Request.URL.Parse(location)
+}
+
+// redirectRequest sends one request with browser headers, without following redirects
+func redirectRequest(method, rawURL string) (*http.Response, error) {
+	req, err := httpclient.NewRequest(method, rawURL)
+	if err != nil {
+		return nil, err
+	}
+	req.Header.Set("Accept", "text/html,application/xhtml+xml,application/xml;q=0.9,image/avif,image/webp,image/apng,*/*;q=0.8")
+
+	return httpclient.NoRedirectClient.Do(req)
+}
+
+// navigate loads urlstr without waiting for the load event (chromedp.Navigate does).
+// Maps keeps fetching tiles and images long after the panel is usable, so callers
+// follow this with a wait for the element they actually need.
+// It does wait for the new document to commit: until then the tab still shows the
+// previous one (about:blank has a <body>, the search page an <h1>), so Location and
+// selector waits would read the old page.
+func navigate(urlstr string) chromedp.Action {
+	return chromedp.ActionFunc(func(ctx context.Context) error {
+		// Tag the current document - the committed one starts without the tag
+		var tagged bool
+		if err := chromedp.Evaluate(`window.__gmaps2vcardStale = true`, &tagged).Do(ctx); err != nil {
+			return err
+		}
+
+		_, _, errorText, _, err := page.Navigate(urlstr).Do(ctx)
+		if err != nil {
+			return err
+		}
+		if errorText != "" {
+			return fmt.Errorf("page load error %s", errorText)
+		}
+		return waitCommitted(ctx)
+	})
+}
+
+// committedJS is true once the tab shows a new, parsed document (DOMContentLoaded)
+const committedJS = `!window.__gmaps2vcardStale && document.readyState !== 'loading'`
+
+// waitCommitted polls until the navigation started by navigate has replaced the document
+func waitCommitted(ctx context.Context) error {
+	for {
+		// Errors are expected while the old execution context is torn down - keep polling
+		var committed bool
+		if err := chromedp.Evaluate(committedJS, &committed).Do(ctx); err == nil && committed {
+			return nil
+		}
+
+		select {
+		case <-time.After(50 * time.Millisecond):
+		case <-ctx.Done():
+			return fmt.Errorf("page never committed: %w", ctx.Err())
+		}
+	}
+}
+
 // extractMapsPlaceFromSearch extracts the maps/place link from a Google search page
 func extractMapsPlaceFromSearch(ctx context.Context, searchURL string, config *Config) (string, error) {
 	var pageURL string
 
-	err := chromedp.Run(ctx,
-		chromedp.Navigate(searchURL),
-		chromedp.WaitReady("body"),
-		chromedp.Sleep(config.WaitTime),
-		chromedp.Location(&pageURL),
-	)
-
+	// navigate returns once the search (or where Google sent it) has committed,
+	// so the Location read below is never the blank tab
+	err := chromedp.Run(ctx, navigate(searchURL))
 	if err != nil {
 		return "", fmt.Errorf("failed to navigate to search page: %w", err)
 	}
 
-	// Check for CAPTCHA
+	if err := chromedp.Run(ctx, chromedp.Location(&pageURL)); err != nil {
+		return "", fmt.Errorf("failed to read search page URL: %w", err)
+	}
+
+	// Check for CAPTCHA (before waiting for links a CAPTCHA page never has)
 	if strings.Contains(pageURL, "/sorry/") {
 		return "", fmt.Errorf("Google CAPTCHA detected - use direct maps/place URL instead")
 	}
 
-	// Try to extract maps/place link from page
-	var hrefURL string
-	err = chromedp.Run(ctx,
-		chromedp.AttributeValue(`div[data-attrid="kc:/location/location:address"] a[href*="/maps/place/"]`, "href", &hrefURL, nil, chromedp.ByQuery),
-	)
-
-	if err == nil && hrefURL != "" {
-		if strings.HasPrefix(hrefURL, "/") {
-			return "https://www.google.com" + hrefURL, nil
-		}
-		return hrefURL, nil
+	// Google sometimes redirects the search straight to the place page - nothing to extract
+	if strings.Contains(pageURL, "/maps/place/") {
+		log.Printf("[Scraper] Search redirected to maps/place, skipping link extraction")
+		return pageURL, nil
 	}
 
-	// Fallback: try data-url attribute
-	var dataURL string
+	// Wait only until a maps/place link exists (bounded)
+	waitFor(ctx, `a[href*="/maps/place/"], a[data-url*="/maps/place/"]`, config.WaitTime)
+
+	// Extract maps/place link in ONE round-trip: address link first, data-url fallback
+	// (AttributeValue would wait for a missing selector until the timeout)
+	var placeURL string
 	err = chromedp.Run(ctx,
-		chromedp.AttributeValue(`a[data-url*="/maps/place/"]`, "data-url", &dataURL, nil, chromedp.ByQuery),
+		chromedp.Evaluate(`
+			(() => {
+				const href = document.querySelector('div[data-attrid="kc:/location/location:address"] a[href*="/maps/place/"]');
+				if (href) return href.getAttribute('href') || '';
+
+				const data = document.querySelector('a[data-url*="/maps/place/"]');
+				return data ? data.getAttribute('data-url') || '' : '';
+			})()
+		`, &placeURL),
 	)
 
-	if err == nil && dataURL != "" {
-		if strings.HasPrefix(dataURL, "/") {
-			return "https://www.google.com" + dataURL, nil
+	if err == nil && placeURL != "" {
+		if strings.HasPrefix(placeURL, "/") {
+			return "https://www.google.com" + placeURL, nil
 		}
-		return dataURL, nil
+		return placeURL, nil
 	}
 
 	return "", fmt.Errorf("no maps/place link found on search page")
@@ -218,32 +494,70 @@ func extractMapsPlaceFromSearch(ctx context.Context, searchURL string, config *C
 
 // extractBusinessData extracts all business data from a maps/place page (in existing chromedp session)
 func extractBusinessData(ctx context.Context, pageURL string, business *BusinessData, config *Config) error {
-	var name, address, phone, website string
+	// The search branch may have left the tab on this very page - don't load it twice
+	// (the read is fresh: navigate only returns once the search's document committed)
+	var currentURL string
+	if err := chromedp.Run(ctx, chromedp.Location(&currentURL)); err != nil {
+		return fmt.Errorf("failed to read tab URL: %w", err)
+	}
 
-	err := chromedp.Run(ctx,
-		chromedp.Navigate(pageURL),
-		chromedp.WaitReady("body"),
-		chromedp.Sleep(config.WaitTime),
-
-		// Extract basic business info
-		chromedp.Text(`h1`, &name, chromedp.NodeVisible, chromedp.ByQuery),
-		chromedp.AttributeValue(`button[data-item-id="address"]`, "aria-label", &address, nil, chromedp.ByQuery),
-		chromedp.AttributeValue(`button[data-item-id*="phone"]`, "aria-label", &phone, nil, chromedp.ByQuery),
-		chromedp.AttributeValue(`a[data-item-id="authority"]`, "href", &website, nil, chromedp.ByQuery),
+	actions := []chromedp.Action{chromedp.WaitVisible(`h1`, chromedp.ByQuery)}
+	if needsNavigation(currentURL, pageURL) {
+		actions = append([]chromedp.Action{navigate(pageURL)}, actions...)
+	} else {
+		log.Printf("[Scraper] Tab already on place page, skipping navigation")
+	}
+
+	err := chromedp.Run(ctx, actions...)
+	if err != nil {
+		return fmt.Errorf("failed to load place page: %w", err)
+	}
+
+	// The info buttons render with the header; give them a bounded moment
+	waitFor(ctx, `button[data-item-id="address"]`, config.WaitTime)
+
+	// Extract basic business info in ONE round-trip (missing fields come back empty
+	// instead of each query waiting for its node until the timeout)
+	var fields struct {
+		Name     string `json:"name"`
+		Address  string `json:"address"`
+		Phone    string `json:"phone"`
+		Website  string `json:"website"`
+		Location string `json:"location"`
+	}
+	err = chromedp.Run(ctx,
+		chromedp.Evaluate(`
+			(() => {
+				const attr = (sel, name) => document.querySelector(sel)?.getAttribute(name) || '';
+				return {
+					name: document.querySelector('h1')?.innerText?.trim() || '',
+					address: attr('button[data-item-id="address"]', 'aria-label'),
+					phone: attr('button[data-item-id*="phone"]', 'aria-label'),
+					website: attr('a[data-item-id="authority"]', 'href'),
+					location: location.href,
+				};
+			})()
+		`, &fields),
 	)
 
 	if err != nil {
 		return fmt.Errorf("failed to extract basic data: %w", err)
 	}
 
-	business.Name = name
-	business.Address = cleanAriaLabel(address)
-	business.Phone = cleanAriaLabel(phone)
-	business.Website = website
+	business.Name = fields.Name
+	business.Address = cleanAriaLabel(fields.Address)
+	business.Phone = cleanAriaLabel(fields.Phone)
+	business.Website = fields.Website
 
-	log.Printf("[Scraper] Raw address: %q", address)
+	// Coordinates: only used when no URL so far carried them
+	// (Maps rewrites the location to include "@lat,lng" once the place loads)
+	if business.Latitude == "" {
+		setCoordinates(business, fields.Location)
+	}
+
+	log.Printf("[Scraper] Raw address: %q", fields.Address)
 	log.Printf("[Scraper] Cleaned address: %q", business.Address)
-	log.Printf("[Scraper] Raw phone: %q", phone)
+	log.Printf("[Scraper] Raw phone: %q", fields.Phone)
 	log.Printf("[Scraper] Cleaned phone: %q", business.Phone)
 
 	// Extract image URL FIRST (before clicking anything that might open modals)
@@ -265,6 +579,12 @@ func extractBusinessData(ctx context.Context, pageURL string, business *Business
 	return nil
 }
 
+// needsNavigation reports whether the tab must load pageURL - only an exact match is
+// the same page (another place, or the blank tab, must never be scraped as this one)
+func needsNavigation(currentURL, pageURL string) bool {
+	return currentURL != pageURL
+}
+
 // extractHours clicks the hours button and extracts the full schedule from table structure
 // Uses multiple fallback strategies for reliability across different Maps page layouts
 func extractHours(ctx context.Context, config *Config) (string, error) {
@@ -275,19 +595,25 @@ func extractHours(ctx context.Context, config *Config) (string, error) {
 		`div.OqCZI[role="button"]`,                       // Class-based fallback
 	}
 
+	// Find the first selector present in ONE round-trip, then click only that one
+	// (clicking each in turn waited 3s on every selector missing from the layout)
+	var selector string
+	err := chromedp.Run(ctx,
+		chromedp.Evaluate(fmt.Sprintf(`%s.find(sel => document.querySelector(sel)) || ''`, jsStringArray(buttonSelectors)), &selector),
+	)
+
 	var clicked bool
-	for _, selector := range buttonSelectors {
-		selectorCtx, cancel := context.WithTimeout(ctx, 3*time.Second)
-		err := chromedp.Run(selectorCtx,
+	if err == nil && selector != "" {
+		clickCtx, cancel := context.WithTimeout(ctx, 3*time.Second)
+		err = chromedp.Run(clickCtx,
 			chromedp.Click(selector, chromedp.ByQuery),
-			chromedp.Sleep(1*time.Second),
 		)
 		cancel()
 
 		if err == nil {
 			clicked = true
 			log.Printf("[Scraper] ✓ Clicked hours button with selector: %s", selector)
-			break
+			waitFor(ctx, `table.eK4R0e tr.y0skZc`, 1*time.Second)
 		}
 	}
 
@@ -297,7 +623,7 @@ func extractHours(ctx context.Context, config *Config) (string, error) {
 
 	// Strategy 2: Extract hours directly from table structure using JavaScript
 	var hoursText string
-	err := chromedp.Run(ctx,
+	err = chromedp.Run(ctx,
 		chromedp.Evaluate(`
 			(() => {
 				const rows = document.querySelectorAll('table.eK4R0e tr.y0skZc');
@@ -321,70 +647,129 @@ func extractHours(ctx context.Context, config *Config) (string, error) {
 
 	// Fallback: Extract from body text (old approach for compatibility)
 	log.Printf("[Scraper] ⚠ Table extraction failed, falling back to body text parsing")
-	var bodyText string
+	// The marker search runs in the page: only the hours section crosses the wire,
+	// not the whole body text
+	var hoursSection string
 	err = chromedp.Run(ctx,
-		chromedp.Text("body", &bodyText, chromedp.ByQuery),
+		chromedp.Evaluate(`
+			(() => {
+				const text = document.body.innerText;
+				const markers = ['Horas\n', 'Hours\n', 'Horario\n'];
+				const endMarkers = ['Sugerir nuevo horario', 'Suggest new hours', 'Ocultar el panel', 'Hide'];
+
+				let section = '';
+				for (const marker of markers) {
+					const idx = text.indexOf(marker);
+					if (idx !== -1) {
+						section = text.slice(idx + marker.length);
+						break;
+					}
+				}
+				if (!section) return '';
+
+				// Trim to end of hours section
+				for (const endMarker of endMarkers) {
+					const endIdx = section.indexOf(endMarker);
+					if (endIdx !== -1) {
+						section = section.slice(0, endIdx);
+						break;
+					}
+				}
+				return section;
+			})()
+		`, &hoursSection),
 	)
 
 	if err != nil {
 		return "", fmt.Errorf("failed to extract body text: %w", err)
 	}
 
-	// Parse out hours section from body text
-	hoursMarkers := []string{"Horas\n", "Hours\n", "Horario\n"}
-	endMarkers := []string{"Sugerir nuevo horario", "Suggest new hours", "Ocultar el panel", "Hide"}
-
-	var hoursSection string
-	for _, marker := range hoursMarkers {
-		if idx := strings.Index(bodyText, marker); idx != -1 {
-			hoursSection = bodyText[idx+len(marker):]
-			break
-		}
-	}
-
 	if hoursSection == "" {
 		return "", fmt.Errorf("hours section not found in page")
 	}
 
-	// Trim to end of hours section
-	for _, endMarker := range endMarkers {
-		if endIdx := strings.Index(hoursSection, endMarker); endIdx != -1 {
-			hoursSection = hoursSection[:endIdx]
-			break
-		}
-	}
-
 	return strings.TrimSpace(hoursSection), nil
 }
 
 // extractImageURL tries multiple selectors to find the business image
 func extractImageURL(ctx context.Context) (string, error) {
-	selectors := []string{
+	// The hero image renders after the info rows, and the generic fallbacks below
+	// already match (e.g. gstatic.com row icons) - so wait on the hero alone
+	hero := []string{
 		`button[jsaction*="pane.heroHeaderImage"] img`,
 		`div.ZKCDEc img`,
+	}
+	selectors := append(hero,
 		`img[src*="googleusercontent.com"]`,
 		`img[src*="gstatic.com/images"]`,
 		`button.aoRNLd img`,
-		`div[role="img"]`,
-	}
+	)
+
+	// Bounded wait for the hero, then take the first selector (in priority order)
+	// with a src in ONE round-trip instead of a 2s timeout per missing selector
+	waitFor(ctx, strings.Join(hero, ", "), 2*time.Second)
 
 	var imageURL string
-	for _, selector := range selectors {
-		// Use a short timeout for each selector (don't waste time on non-matching selectors)
-		selectorCtx, cancel := context.WithTimeout(ctx, 2*time.Second)
-		err := chromedp.Run(selectorCtx,
-			chromedp.AttributeValue(selector, "src", &imageURL, nil, chromedp.ByQuery),
-		)
-		cancel()
+	err := chromedp.Run(ctx,
+		chromedp.Evaluate(fmt.Sprintf(`
+			(() => {
+				for (const sel of %s) {
+					const src = document.querySelector(sel)?.getAttribute('src');
+					if (src) return src;
+				}
+				return '';
+			})()
+		`, jsStringArray(selectors)), &imageURL),
+	)
 
-		if err == nil && imageURL != "" {
-			return imageURL, nil
-		}
+	if err == nil && imageURL != "" {
+		return imageURL, nil
 	}
 
 	return "", fmt.Errorf("no image found with any selector")
 }
 
+// jsStringArray renders strs as a JavaScript array literal (JSON is valid JS)
+func jsStringArray(strs []string) string {
+	encoded, _ := json.Marshal(strs)
+	return string(encoded)
+}
+
+// queryParam returns the decoded value of key from a raw query string
+// Single pass with no url.Values map - we only ever need one or two keys
+func queryParam(rawQuery, key string) string {
+	for rawQuery != "" {
+		var pair string
+		pair, rawQuery, _ = strings.Cut(rawQuery, "&")
+
+		name, value, _ := strings.Cut(pair, "=")
+		if name != key {
+			continue
+		}
+		if decoded, err := url.QueryUnescape(value); err == nil {
+			return decoded
+		}
+		return value
+	}
+	return ""
+}
+
+// setCoordinates fills Latitude/Longitude from an "@lat,lng" URL segment, if present
+func setCoordinates(business *BusinessData, rawURL string) {
+	if matches := coordsRe.FindStringSubmatch(rawURL); len(matches) == 3 {
+		business.Latitude = matches[1]
+		business.Longitude = matches[2]
+	}
+}
+
+// waitFor waits up to timeout for selector to appear; timing out is not an error
+// Replaces fixed sleeps: returns as soon as the node exists
+func waitFor(ctx context.Context, selector string, timeout time.Duration) {
+	waitCtx, cancel := context.WithTimeout(ctx, timeout)
+	defer cancel()
+	_ = chromedp.Run(waitCtx, chromedp.WaitReady(selector, chromedp.ByQuery))
+}
+
 // cleanAriaLabel removes common aria-label prefixes
 func cleanAriaLabel(s string) string {
 	prefixes := []string{
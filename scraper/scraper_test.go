@@ -0,0 +1,25 @@
+package scraper
+
+import "testing"
+
+func TestNeedsNavigation(t *testing.T) {
+	const place = "https://www.google.com/maps/place/Cafe/@40.4,-3.7,17z/data=!3m1!4b1"
+
+	tests := []struct {
+		name       string
+		currentURL string
+		want       bool
+	}{
+		{"search landed on the place page", place, false},
+		{"blank tab", "about:blank", true},
+		{"still on the search page", "https://www.google.com/search?q=cafe", true},
+		{"same place, different viewport", "https://www.google.com/maps/place/Cafe/@40.5,-3.7,15z/data=!3m1!4b1", true},
+		{"empty location", "", true},
+	}
+
+	for _, tt := range tests {
+		if got := needsNavigation(tt.currentURL, place); got != tt.want {
+			t.Errorf("%s: needsNavigation(%q) = %v, want %v", tt.name, tt.currentURL, got, tt.want)
+		}
+	}
+}